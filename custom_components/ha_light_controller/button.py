@@ -19,7 +19,7 @@ from .const import (
     PRESET_STATUS_FAILED,
     PRESET_STATUS_SUCCESS,
 )
-from .preset_manager import PresetConfig, PresetManager
+from .preset_manager import PresetConfig, PresetManager, PresetStatus
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,24 +42,27 @@ async def async_setup_entry(
     @callback
     def async_add_preset_buttons() -> None:
         """Add button entities for new presets."""
+        presets = preset_manager.presets
+
         # Clean up tracking for deleted presets
-        added_preset_ids.intersection_update(preset_manager.presets.keys())
+        added_preset_ids.intersection_update(presets.keys())
+        if len(added_preset_ids) == len(presets):
+            return
 
         new_entities: list[PresetButton] = []
 
-        for preset_id, preset in preset_manager.presets.items():
-            if preset_id not in added_preset_ids:
-                entity = PresetButton(
-                    hass=hass,
-                    entry=entry,
-                    preset_manager=preset_manager,
-                    controller=controller,
-                    preset_id=preset_id,
-                    preset=preset,
-                )
-                new_entities.append(entity)
-                added_preset_ids.add(preset_id)
-                _LOGGER.debug("Adding button for preset: %s", preset.name)
+        for preset_id in presets.keys() - added_preset_ids:
+            preset = presets[preset_id]
+            entity = PresetButton(
+                entry=entry,
+                preset_manager=preset_manager,
+                controller=controller,
+                preset_id=preset_id,
+                preset=preset,
+            )
+            new_entities.append(entity)
+            added_preset_ids.add(preset_id)
+            _LOGGER.debug("Adding button for preset: %s", preset.name)
 
         if new_entities:
             async_add_entities(new_entities)
@@ -79,7 +82,6 @@ class PresetButton(ButtonEntity):
 
     def __init__(
         self,
-        hass: HomeAssistant,
         entry: LightControllerConfigEntry,
         preset_manager: PresetManager,
         controller: Any,
@@ -87,7 +89,6 @@ class PresetButton(ButtonEntity):
         preset: PresetConfig,
     ) -> None:
         """Initialize the preset button."""
-        self.hass = hass
         self._entry = entry
         self._preset_manager = preset_manager
         self._controller = controller
@@ -97,24 +98,23 @@ class PresetButton(ButtonEntity):
         # Entity attributes
         self._attr_unique_id = f"{entry.entry_id}_preset_{preset_id}_button"
         self._attr_translation_placeholders = {"name": preset.name}
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for the preset."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
             name="Light Controller",
             manufacturer="Light Controller",
             model="Preset Manager",
         )
+        self._attrs_preset: PresetConfig | None = None
+        self._preset_attrs: dict[str, Any] = {}
+        self._attr_extra_state_attributes = self._build_attributes(
+            preset, preset_manager.get_status(preset_id)
+        )
+        self._attr_available = True
+        self._removing = False
+        self._last_written: tuple[Any, ...] | None = None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        preset = self._preset_manager.get_preset(self._preset_id)
-        if not preset:
-            return {}
-
+    def _build_preset_attributes(self, preset: PresetConfig) -> dict[str, Any]:
+        """Build the attributes that only change with the preset configuration."""
         attrs = {
             "preset_id": self._preset_id,
             "entities": preset.entities,
@@ -131,8 +131,19 @@ class PresetButton(ButtonEntity):
         if preset.targets:
             attrs["target_count"] = len(preset.targets)
 
+        return attrs
+
+    def _build_attributes(
+        self, preset: PresetConfig, status: PresetStatus
+    ) -> dict[str, Any]:
+        """Build the extra state attributes for the preset and its status."""
+        # Status changes far more often than the preset, so reuse its part
+        if preset is not self._attrs_preset:
+            self._attrs_preset = preset
+            self._preset_attrs = self._build_preset_attributes(preset)
+        attrs = self._preset_attrs.copy()
+
         # Add last activation result
-        status = self._preset_manager.get_status(self._preset_id)
         if status.last_result:
             attrs["last_result"] = status.last_result.get("result", "unknown")
         if status.last_activated:
@@ -140,11 +151,6 @@ class PresetButton(ButtonEntity):
 
         return attrs
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self._preset_manager.get_preset(self._preset_id) is not None
-
     async def async_press(self) -> None:
         """Handle button press - activate the preset."""
         preset = self._preset_manager.get_preset(self._preset_id)
@@ -179,11 +185,28 @@ class PresetButton(ButtonEntity):
         """Handle preset updates."""
         preset = self._preset_manager.get_preset(self._preset_id)
         if preset:
+            # Skip the state write when nothing the state is built from changed
+            status = self._preset_manager.get_status(self._preset_id)
+            written = (
+                preset,
+                status.status,
+                status.last_activated,
+                status.last_result,
+            )
+            if written == self._last_written:
+                return
+            self._last_written = written
+
             self._preset = preset
             self._attr_translation_placeholders = {"name": preset.name}
+            self._attr_extra_state_attributes = self._build_attributes(preset, status)
             self.async_write_ha_state()
-        elif self.hass:
-            self.hass.async_create_task(self.async_remove())
+        else:
+            self._attr_available = False
+            # Several notifications can arrive before the removal runs
+            if self.hass and not self._removing:
+                self._removing = True
+                self.hass.async_create_task(self.async_remove())
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
@@ -191,7 +214,9 @@ class PresetButton(ButtonEntity):
 
         # Register for updates
         self.async_on_remove(
-            self._preset_manager.register_listener(self._handle_preset_update)
+            self._preset_manager.register_preset_listener(
+                self._preset_id, self._handle_preset_update
+            )
         )
 
     async def async_will_remove_from_hass(self) -> None:
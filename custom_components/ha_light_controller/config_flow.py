@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import Awaitable, Callable, Mapping
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Final
 
 import voluptuous as vol
 from homeassistant.config_entries import (
@@ -16,6 +18,9 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import section
 from homeassistant.helpers import selector
 
+if TYPE_CHECKING:
+    from .preset_manager import PresetConfig, PresetManager
+
 from .const import (
     COLOR_MODE_COLOR_TEMP,
     COLOR_MODE_NONE,
@@ -57,6 +62,203 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+# (option key, default) pairs stored on a new entry; user input overrides defaults
+_USER_OPTION_SPEC: Final[tuple[tuple[str, Any], ...]] = (
+    (CONF_DEFAULT_BRIGHTNESS_PCT, DEFAULT_BRIGHTNESS_PCT),
+    (CONF_DEFAULT_TRANSITION, DEFAULT_TRANSITION),
+    (CONF_BRIGHTNESS_TOLERANCE, DEFAULT_BRIGHTNESS_TOLERANCE),
+    (CONF_RGB_TOLERANCE, DEFAULT_RGB_TOLERANCE),
+    (CONF_KELVIN_TOLERANCE, DEFAULT_KELVIN_TOLERANCE),
+    (CONF_DELAY_AFTER_SEND, DEFAULT_DELAY_AFTER_SEND),
+    (CONF_MAX_RETRIES, DEFAULT_MAX_RETRIES),
+    (CONF_MAX_RUNTIME_SECONDS, DEFAULT_MAX_RUNTIME_SECONDS),
+    (CONF_USE_EXPONENTIAL_BACKOFF, DEFAULT_USE_EXPONENTIAL_BACKOFF),
+    (CONF_MAX_BACKOFF_SECONDS, DEFAULT_MAX_BACKOFF_SECONDS),
+    (CONF_LOG_SUCCESS, DEFAULT_LOG_SUCCESS),
+)
+
+
+def _slider(
+    min_value: float, max_value: float, step: float, unit: str | None = None
+) -> selector.NumberSelector:
+    """Build a slider number selector."""
+    config = selector.NumberSelectorConfig(
+        min=min_value,
+        max=max_value,
+        step=step,
+        mode=selector.NumberSelectorMode.SLIDER,
+    )
+    if unit is not None:
+        config["unit_of_measurement"] = unit
+    return selector.NumberSelector(config)
+
+
+# Selectors are stateless, so each one is built once at import and shared by
+# every form render instead of being reconstructed per step.
+_BRIGHTNESS_PCT_SELECTOR = _slider(1, 100, 1, "%")
+_TRANSITION_SELECTOR = _slider(0, 60, 0.5, "s")
+_BRIGHTNESS_TOLERANCE_SELECTOR = _slider(0, 20, 1, "%")
+_RGB_TOLERANCE_SELECTOR = _slider(0, 50, 1)
+_KELVIN_TOLERANCE_SELECTOR = _slider(0, 500, 10, "K")
+_DELAY_AFTER_SEND_SELECTOR = _slider(0.5, 30, 0.5, "s")
+_MAX_RETRIES_SELECTOR = _slider(1, 10, 1)
+_MAX_RUNTIME_SECONDS_SELECTOR = _slider(10, 300, 10, "s")
+_MAX_BACKOFF_SECONDS_SELECTOR = _slider(5, 120, 5, "s")
+_COLOR_TEMP_KELVIN_SELECTOR = _slider(2000, 6500, 100, "K")
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
+_RGB_COLOR_SELECTOR = selector.ColorRGBSelector()
+_TEXT_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
+)
+_LIGHT_ENTITIES_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=["light", "group"], multiple=True)
+)
+_STATE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value="on", label="On"),
+            selector.SelectOptionDict(value="off", label="Off"),
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+_COLOR_MODE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value=COLOR_MODE_NONE, label="No Color"),
+            selector.SelectOptionDict(
+                value=COLOR_MODE_COLOR_TEMP, label="Color Temperature"
+            ),
+            selector.SelectOptionDict(value=COLOR_MODE_RGB, label="RGB Color"),
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+_ENTITY_MENU_ACTION_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value="configure", label="Configure an entity"),
+            selector.SelectOptionDict(value="add", label="Add more entities"),
+            selector.SelectOptionDict(value="remove", label="Remove an entity"),
+            selector.SelectOptionDict(value="save", label="Save preset"),
+        ],
+        mode=selector.SelectSelectorMode.LIST,
+    )
+)
+
+# Settings form; current options are injected as suggested values per render
+_SETTINGS_SECTIONS: Final = (
+    "defaults",
+    "tolerances",
+    "retry_settings",
+    "notifications",
+)
+_SETTINGS_SCHEMA = vol.Schema(
+    {
+        # Defaults section - expanded by default (most common settings)
+        vol.Required("defaults"): section(
+            vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_DEFAULT_BRIGHTNESS_PCT, default=DEFAULT_BRIGHTNESS_PCT
+                    ): _BRIGHTNESS_PCT_SELECTOR,
+                    vol.Optional(
+                        CONF_DEFAULT_TRANSITION, default=DEFAULT_TRANSITION
+                    ): _TRANSITION_SELECTOR,
+                }
+            ),
+            {"collapsed": False},
+        ),
+        # Tolerances section - collapsed (advanced)
+        vol.Required("tolerances"): section(
+            vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_BRIGHTNESS_TOLERANCE, default=DEFAULT_BRIGHTNESS_TOLERANCE
+                    ): _BRIGHTNESS_TOLERANCE_SELECTOR,
+                    vol.Optional(
+                        CONF_RGB_TOLERANCE, default=DEFAULT_RGB_TOLERANCE
+                    ): _RGB_TOLERANCE_SELECTOR,
+                    vol.Optional(
+                        CONF_KELVIN_TOLERANCE, default=DEFAULT_KELVIN_TOLERANCE
+                    ): _KELVIN_TOLERANCE_SELECTOR,
+                }
+            ),
+            {"collapsed": True},
+        ),
+        # Retry settings section - collapsed (advanced)
+        vol.Required("retry_settings"): section(
+            vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_DELAY_AFTER_SEND, default=DEFAULT_DELAY_AFTER_SEND
+                    ): _DELAY_AFTER_SEND_SELECTOR,
+                    vol.Optional(
+                        CONF_MAX_RETRIES, default=DEFAULT_MAX_RETRIES
+                    ): _MAX_RETRIES_SELECTOR,
+                    vol.Optional(
+                        CONF_MAX_RUNTIME_SECONDS, default=DEFAULT_MAX_RUNTIME_SECONDS
+                    ): _MAX_RUNTIME_SECONDS_SELECTOR,
+                    vol.Optional(
+                        CONF_USE_EXPONENTIAL_BACKOFF,
+                        default=DEFAULT_USE_EXPONENTIAL_BACKOFF,
+                    ): _BOOLEAN_SELECTOR,
+                    vol.Optional(
+                        CONF_MAX_BACKOFF_SECONDS, default=DEFAULT_MAX_BACKOFF_SECONDS
+                    ): _MAX_BACKOFF_SECONDS_SELECTOR,
+                }
+            ),
+            {"collapsed": True},
+        ),
+        # Notifications section - collapsed (advanced)
+        vol.Required("notifications"): section(
+            vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_LOG_SUCCESS, default=DEFAULT_LOG_SUCCESS
+                    ): _BOOLEAN_SELECTOR,
+                }
+            ),
+            {"collapsed": True},
+        ),
+    }
+)
+
+# Form shown by the add_preset step
+_ADD_PRESET_SCHEMA = vol.Schema(
+    {
+        vol.Required(PRESET_NAME): _TEXT_SELECTOR,
+        vol.Required(PRESET_ENTITIES): _LIGHT_ENTITIES_SELECTOR,
+        vol.Optional(PRESET_SKIP_VERIFICATION, default=False): _BOOLEAN_SELECTOR,
+    }
+)
+
+
+type _PresetStep = Callable[
+    [LightControllerOptionsFlow, dict[str, Any] | None, PresetManager],
+    Awaitable[ConfigFlowResult],
+]
+type _FlowStep = Callable[
+    [LightControllerOptionsFlow, dict[str, Any] | None],
+    Awaitable[ConfigFlowResult],
+]
+
+
+def _require_presets(step: _PresetStep) -> _FlowStep:
+    """Redirect to manage_presets unless presets exist; inject the preset manager."""
+
+    @wraps(step)
+    async def wrapper(
+        self: LightControllerOptionsFlow, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        preset_manager = self._get_preset_manager()
+        if not preset_manager or not preset_manager.presets:
+            return await self.async_step_manage_presets()
+        return await step(self, user_input, preset_manager)
+
+    return wrapper
+
+
 class LightControllerConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Light Controller."""
 
@@ -77,39 +279,8 @@ class LightControllerConfigFlow(ConfigFlow, domain=DOMAIN):
                 title="Light Controller",
                 data={},
                 options={
-                    CONF_DEFAULT_BRIGHTNESS_PCT: user_input.get(
-                        CONF_DEFAULT_BRIGHTNESS_PCT, DEFAULT_BRIGHTNESS_PCT
-                    ),
-                    CONF_DEFAULT_TRANSITION: user_input.get(
-                        CONF_DEFAULT_TRANSITION, DEFAULT_TRANSITION
-                    ),
-                    CONF_BRIGHTNESS_TOLERANCE: user_input.get(
-                        CONF_BRIGHTNESS_TOLERANCE, DEFAULT_BRIGHTNESS_TOLERANCE
-                    ),
-                    CONF_RGB_TOLERANCE: user_input.get(
-                        CONF_RGB_TOLERANCE, DEFAULT_RGB_TOLERANCE
-                    ),
-                    CONF_KELVIN_TOLERANCE: user_input.get(
-                        CONF_KELVIN_TOLERANCE, DEFAULT_KELVIN_TOLERANCE
-                    ),
-                    CONF_DELAY_AFTER_SEND: user_input.get(
-                        CONF_DELAY_AFTER_SEND, DEFAULT_DELAY_AFTER_SEND
-                    ),
-                    CONF_MAX_RETRIES: user_input.get(
-                        CONF_MAX_RETRIES, DEFAULT_MAX_RETRIES
-                    ),
-                    CONF_MAX_RUNTIME_SECONDS: user_input.get(
-                        CONF_MAX_RUNTIME_SECONDS, DEFAULT_MAX_RUNTIME_SECONDS
-                    ),
-                    CONF_USE_EXPONENTIAL_BACKOFF: user_input.get(
-                        CONF_USE_EXPONENTIAL_BACKOFF, DEFAULT_USE_EXPONENTIAL_BACKOFF
-                    ),
-                    CONF_MAX_BACKOFF_SECONDS: user_input.get(
-                        CONF_MAX_BACKOFF_SECONDS, DEFAULT_MAX_BACKOFF_SECONDS
-                    ),
-                    CONF_LOG_SUCCESS: user_input.get(
-                        CONF_LOG_SUCCESS, DEFAULT_LOG_SUCCESS
-                    ),
+                    key: user_input.get(key, default)
+                    for key, default in _USER_OPTION_SPEC
                 },
             )
 
@@ -121,27 +292,11 @@ class LightControllerConfigFlow(ConfigFlow, domain=DOMAIN):
                     vol.Optional(
                         CONF_DEFAULT_BRIGHTNESS_PCT,
                         default=DEFAULT_BRIGHTNESS_PCT,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1,
-                            max=100,
-                            step=1,
-                            unit_of_measurement="%",
-                            mode=selector.NumberSelectorMode.SLIDER,
-                        )
-                    ),
+                    ): _BRIGHTNESS_PCT_SELECTOR,
                     vol.Optional(
                         CONF_DEFAULT_TRANSITION,
                         default=DEFAULT_TRANSITION,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=60,
-                            step=0.5,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.SLIDER,
-                        )
-                    ),
+                    ): _TRANSITION_SELECTOR,
                 }
             ),
             errors=errors,
@@ -158,6 +313,21 @@ class LightControllerConfigFlow(ConfigFlow, domain=DOMAIN):
 class LightControllerOptionsFlow(OptionsFlow):
     """Handle options flow for Light Controller."""
 
+    def __init__(self) -> None:
+        """Initialize the working state shared across preset steps."""
+        self._preset_data: dict[str, Any] = {}
+        self._configuring_entity: str | None = None
+        self._editing_preset_id: str | None = None
+        self._deleting_preset_id: str | None = None
+        self._preset_options: dict[
+            str,
+            tuple[
+                int,
+                list[selector.SelectOptionDict],
+                dict[str, tuple[PresetConfig, selector.SelectOptionDict]],
+            ],
+        ] = {}
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -175,199 +345,24 @@ class LightControllerOptionsFlow(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle all configuration settings with collapsible sections."""
+        options = self.config_entry.options
+
         if user_input is not None:
-            # Flatten nested section data into a single dict
-            flat_options = {}
+            # Copy current options, then flatten nested section data over them
+            new_options = dict(options)
             for key, value in user_input.items():
                 if isinstance(value, dict):
                     # This is a section - merge its contents
-                    flat_options.update(value)
+                    new_options.update(value)
                 else:
-                    flat_options[key] = value
+                    new_options[key] = value
 
-            new_options = {**self.config_entry.options, **flat_options}
             return self.async_create_entry(title="", data=new_options)
 
-        options = self.config_entry.options
-
         return self.async_show_form(
             step_id="settings",
-            data_schema=vol.Schema(
-                {
-                    # Defaults section - expanded by default (most common settings)
-                    vol.Required("defaults"): section(
-                        vol.Schema(
-                            {
-                                vol.Optional(
-                                    CONF_DEFAULT_BRIGHTNESS_PCT,
-                                    default=options.get(
-                                        CONF_DEFAULT_BRIGHTNESS_PCT,
-                                        DEFAULT_BRIGHTNESS_PCT,
-                                    ),
-                                ): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=1,
-                                        max=100,
-                                        step=1,
-                                        unit_of_measurement="%",
-                                        mode=selector.NumberSelectorMode.SLIDER,
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_DEFAULT_TRANSITION,
-                                    default=options.get(
-                                        CONF_DEFAULT_TRANSITION, DEFAULT_TRANSITION
-                                    ),
-                                ): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=0,
-                                        max=60,
-                                        step=0.5,
-                                        unit_of_measurement="s",
-                                        mode=selector.NumberSelectorMode.SLIDER,
-                                    )
-                                ),
-                            }
-                        ),
-                        {"collapsed": False},
-                    ),
-                    # Tolerances section - collapsed (advanced)
-                    vol.Required("tolerances"): section(
-                        vol.Schema(
-                            {
-                                vol.Optional(
-                                    CONF_BRIGHTNESS_TOLERANCE,
-                                    default=options.get(
-                                        CONF_BRIGHTNESS_TOLERANCE,
-                                        DEFAULT_BRIGHTNESS_TOLERANCE,
-                                    ),
-                                ): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=0,
-                                        max=20,
-                                        step=1,
-                                        unit_of_measurement="%",
-                                        mode=selector.NumberSelectorMode.SLIDER,
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_RGB_TOLERANCE,
-                                    default=options.get(
-                                        CONF_RGB_TOLERANCE, DEFAULT_RGB_TOLERANCE
-                                    ),
-                                ): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=0,
-                                        max=50,
-                                        step=1,
-                                        mode=selector.NumberSelectorMode.SLIDER,
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_KELVIN_TOLERANCE,
-                                    default=options.get(
-                                        CONF_KELVIN_TOLERANCE, DEFAULT_KELVIN_TOLERANCE
-                                    ),
-                                ): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=0,
-                                        max=500,
-                                        step=10,
-                                        unit_of_measurement="K",
-                                        mode=selector.NumberSelectorMode.SLIDER,
-                                    )
-                                ),
-                            }
-                        ),
-                        {"collapsed": True},
-                    ),
-                    # Retry settings section - collapsed (advanced)
-                    vol.Required("retry_settings"): section(
-                        vol.Schema(
-                            {
-                                vol.Optional(
-                                    CONF_DELAY_AFTER_SEND,
-                                    default=options.get(
-                                        CONF_DELAY_AFTER_SEND, DEFAULT_DELAY_AFTER_SEND
-                                    ),
-                                ): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=0.5,
-                                        max=30,
-                                        step=0.5,
-                                        unit_of_measurement="s",
-                                        mode=selector.NumberSelectorMode.SLIDER,
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_MAX_RETRIES,
-                                    default=options.get(
-                                        CONF_MAX_RETRIES, DEFAULT_MAX_RETRIES
-                                    ),
-                                ): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=1,
-                                        max=10,
-                                        step=1,
-                                        mode=selector.NumberSelectorMode.SLIDER,
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_MAX_RUNTIME_SECONDS,
-                                    default=options.get(
-                                        CONF_MAX_RUNTIME_SECONDS,
-                                        DEFAULT_MAX_RUNTIME_SECONDS,
-                                    ),
-                                ): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=10,
-                                        max=300,
-                                        step=10,
-                                        unit_of_measurement="s",
-                                        mode=selector.NumberSelectorMode.SLIDER,
-                                    )
-                                ),
-                                vol.Optional(
-                                    CONF_USE_EXPONENTIAL_BACKOFF,
-                                    default=options.get(
-                                        CONF_USE_EXPONENTIAL_BACKOFF,
-                                        DEFAULT_USE_EXPONENTIAL_BACKOFF,
-                                    ),
-                                ): selector.BooleanSelector(),
-                                vol.Optional(
-                                    CONF_MAX_BACKOFF_SECONDS,
-                                    default=options.get(
-                                        CONF_MAX_BACKOFF_SECONDS,
-                                        DEFAULT_MAX_BACKOFF_SECONDS,
-                                    ),
-                                ): selector.NumberSelector(
-                                    selector.NumberSelectorConfig(
-                                        min=5,
-                                        max=120,
-                                        step=5,
-                                        unit_of_measurement="s",
-                                        mode=selector.NumberSelectorMode.SLIDER,
-                                    )
-                                ),
-                            }
-                        ),
-                        {"collapsed": True},
-                    ),
-                    # Notifications section - collapsed (advanced)
-                    vol.Required("notifications"): section(
-                        vol.Schema(
-                            {
-                                vol.Optional(
-                                    CONF_LOG_SUCCESS,
-                                    default=options.get(
-                                        CONF_LOG_SUCCESS, DEFAULT_LOG_SUCCESS
-                                    ),
-                                ): selector.BooleanSelector(),
-                            }
-                        ),
-                        {"collapsed": True},
-                    ),
-                }
+            data_schema=self.add_suggested_values_to_schema(
+                _SETTINGS_SCHEMA, dict.fromkeys(_SETTINGS_SECTIONS, options)
             ),
         )
 
@@ -402,25 +397,49 @@ class LightControllerOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="add_preset",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(PRESET_NAME): selector.TextSelector(
-                        selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
-                    ),
-                    vol.Required(PRESET_ENTITIES): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain=["light", "group"],
-                            multiple=True,
-                        )
-                    ),
-                    vol.Optional(
-                        PRESET_SKIP_VERIFICATION, default=False
-                    ): selector.BooleanSelector(),
-                }
-            ),
+            data_schema=_ADD_PRESET_SCHEMA,
             errors=errors,
         )
 
+    def _get_preset_manager(self) -> PresetManager | None:
+        """Get the preset manager from runtime_data, if the entry is loaded."""
+        runtime_data = getattr(self.config_entry, "runtime_data", None)
+        if not runtime_data:
+            return None
+        preset_manager: PresetManager | None = runtime_data.preset_manager
+        return preset_manager
+
+    def _get_preset_options(
+        self,
+        step_id: str,
+        version: int,
+        presets: Mapping[str, PresetConfig],
+        label: Callable[[PresetConfig], str],
+    ) -> list[selector.SelectOptionDict]:
+        """Get a step's preset select options, rebuilt only when presets change.
+
+        On a change, options for presets that are still the same object are
+        reused, so only added or replaced presets get a new option.
+        """
+        cached = self._preset_options.get(step_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        previous = cached[2] if cached is not None else {}
+        entries: dict[str, tuple[PresetConfig, selector.SelectOptionDict]] = {}
+        for pid, preset in presets.items():
+            entry = previous.get(pid)
+            if entry is None or entry[0] is not preset:
+                entry = (
+                    preset,
+                    selector.SelectOptionDict(value=pid, label=label(preset)),
+                )
+            entries[pid] = entry
+
+        options = [option for _, option in entries.values()]
+        self._preset_options[step_id] = (version, options, entries)
+        return options
+
     def _get_entity_friendly_name(self, entity_id: str) -> str:
         """Get friendly name for an entity."""
         entity_state = self.hass.states.get(entity_id)
@@ -494,24 +513,11 @@ class LightControllerOptionsFlow(OptionsFlow):
                 else:
                     return await self._create_preset_from_data()
 
-        # Build action options
-        action_options = [
-            selector.SelectOptionDict(value="configure", label="Configure an entity"),
-            selector.SelectOptionDict(value="add", label="Add more entities"),
-            selector.SelectOptionDict(value="remove", label="Remove an entity"),
-            selector.SelectOptionDict(value="save", label="Save preset"),
-        ]
-
         return self.async_show_form(
             step_id="preset_entity_menu",
             data_schema=vol.Schema(
                 {
-                    vol.Required("action"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=action_options,
-                            mode=selector.SelectSelectorMode.LIST,
-                        )
-                    ),
+                    vol.Required("action"): _ENTITY_MENU_ACTION_SELECTOR,
                 }
             ),
             description_placeholders={
@@ -566,7 +572,7 @@ class LightControllerOptionsFlow(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Configure a specific entity's settings."""
-        entity_id = getattr(self, "_configuring_entity", None)
+        entity_id = self._configuring_entity
         if not entity_id:
             return await self.async_step_preset_entity_menu()
 
@@ -631,70 +637,20 @@ class LightControllerOptionsFlow(OptionsFlow):
             step_id="configure_entity",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(
-                        PRESET_STATE, default=default_state
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(value="on", label="On"),
-                                selector.SelectOptionDict(value="off", label="Off"),
-                            ],
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
+                    vol.Optional(PRESET_STATE, default=default_state): _STATE_SELECTOR,
                     vol.Optional(
                         PRESET_TRANSITION, default=default_transition
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=60,
-                            step=0.5,
-                            unit_of_measurement="s",
-                            mode=selector.NumberSelectorMode.SLIDER,
-                        )
-                    ),
+                    ): _TRANSITION_SELECTOR,
                     vol.Optional(
                         PRESET_BRIGHTNESS_PCT, default=default_brightness
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1,
-                            max=100,
-                            step=1,
-                            unit_of_measurement="%",
-                            mode=selector.NumberSelectorMode.SLIDER,
-                        )
-                    ),
+                    ): _BRIGHTNESS_PCT_SELECTOR,
                     vol.Optional(
                         PRESET_COLOR_MODE, default=default_color_mode
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(
-                                    value=COLOR_MODE_NONE, label="No Color"
-                                ),
-                                selector.SelectOptionDict(
-                                    value=COLOR_MODE_COLOR_TEMP,
-                                    label="Color Temperature",
-                                ),
-                                selector.SelectOptionDict(
-                                    value=COLOR_MODE_RGB, label="RGB Color"
-                                ),
-                            ],
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
+                    ): _COLOR_MODE_SELECTOR,
                     vol.Optional(
                         PRESET_COLOR_TEMP_KELVIN, default=default_color_temp
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=2000,
-                            max=6500,
-                            step=100,
-                            unit_of_measurement="K",
-                            mode=selector.NumberSelectorMode.SLIDER,
-                        )
-                    ),
-                    vol.Optional(PRESET_RGB_COLOR): selector.ColorRGBSelector(),
+                    ): _COLOR_TEMP_KELVIN_SELECTOR,
+                    vol.Optional(PRESET_RGB_COLOR): _RGB_COLOR_SELECTOR,
                 }
             ),
             description_placeholders={
@@ -709,12 +665,12 @@ class LightControllerOptionsFlow(OptionsFlow):
         if user_input is not None:
             new_entities = user_input.get("new_entities", [])
             if new_entities:
-                # Add new entities to the list (avoid duplicates)
+                # Add new entities to the list (avoid duplicates). Build a new
+                # list: when editing, the current one is the stored preset's.
                 current_entities = self._preset_data.get(PRESET_ENTITIES, [])
-                for entity_id in new_entities:
-                    if entity_id not in current_entities:
-                        current_entities.append(entity_id)
-                self._preset_data[PRESET_ENTITIES] = current_entities
+                self._preset_data[PRESET_ENTITIES] = list(
+                    dict.fromkeys([*current_entities, *new_entities])
+                )
 
             return await self.async_step_preset_entity_menu()
 
@@ -725,12 +681,7 @@ class LightControllerOptionsFlow(OptionsFlow):
             step_id="add_more_entities",
             data_schema=vol.Schema(
                 {
-                    vol.Optional("new_entities"): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain=["light", "group"],
-                            multiple=True,
-                        )
-                    ),
+                    vol.Optional("new_entities"): _LIGHT_ENTITIES_SELECTOR,
                 }
             ),
             description_placeholders={
@@ -747,9 +698,10 @@ class LightControllerOptionsFlow(OptionsFlow):
         if user_input is not None:
             entity_to_remove = user_input.get("entity_to_remove")
             if entity_to_remove and entity_to_remove in entities:
-                # Remove from entities list
-                entities.remove(entity_to_remove)
-                self._preset_data[PRESET_ENTITIES] = entities
+                # Remove from entities list (copy-on-write, see add_more_entities)
+                self._preset_data[PRESET_ENTITIES] = [
+                    e for e in entities if e != entity_to_remove
+                ]
                 # Also remove from targets if configured
                 targets = self._preset_data.get("targets", {})
                 if entity_to_remove in targets:
@@ -791,77 +743,68 @@ class LightControllerOptionsFlow(OptionsFlow):
 
         # Derive preset-level state from per-entity targets
         # If all targets are "off", preset state is "off"; otherwise "on"
-        target_states = [t.get("state", "on") for t in targets]
         preset_state = (
-            "off" if target_states and all(s == "off" for s in target_states) else "on"
+            "off"
+            if targets and all(t.get("state", "on") == "off" for t in targets)
+            else "on"
         )
 
         # Derive preset-level transition from per-entity targets
         # Use the maximum transition among targets (or 0.0 if none set)
-        target_transitions = [t.get("transition", 0) for t in targets]
-        preset_transition = (
-            float(max(target_transitions)) if target_transitions else 0.0
+        preset_transition = float(
+            max((t.get("transition", 0) for t in targets), default=0.0)
         )
 
         # Check if we're editing an existing preset
-        editing_preset_id = getattr(self, "_editing_preset_id", None)
-
-        # Get preset manager from runtime_data
-        if (
-            hasattr(self.config_entry, "runtime_data")
-            and self.config_entry.runtime_data
-        ):
-            preset_manager = self.config_entry.runtime_data.preset_manager
-            if preset_manager:
-                if editing_preset_id and editing_preset_id in preset_manager.presets:
-                    # Delete old preset and create new one with same ID
-                    await preset_manager.delete_preset(editing_preset_id)
-                    await preset_manager.create_preset(
-                        name=name,
-                        entities=entities,
-                        state=preset_state,
-                        targets=targets,
-                        transition=preset_transition,
-                        skip_verification=data.get(PRESET_SKIP_VERIFICATION, False),
-                    )
-                    _LOGGER.info(
-                        "Updated preset: %s with %d entity configs", name, len(targets)
-                    )
-                else:
-                    # Create new preset
-                    await preset_manager.create_preset(
-                        name=name,
-                        entities=entities,
-                        state=preset_state,
-                        targets=targets,
-                        transition=preset_transition,
-                        skip_verification=data.get(PRESET_SKIP_VERIFICATION, False),
-                    )
-                    _LOGGER.info(
-                        "Created preset: %s with %d entity configs", name, len(targets)
-                    )
-
-        # Clear stored data
-        self._preset_data = {}
-        self._configuring_entity = None
-        self._editing_preset_id = None
+        editing_preset_id = self._editing_preset_id
+
+        preset_manager = self._get_preset_manager()
+        if preset_manager is None:
+            self._clear_stored_data()
+            return self.async_create_entry(title="", data=self.config_entry.options)
+
+        preset_kwargs: dict[str, Any] = {
+            "name": name,
+            "entities": entities,
+            "state": preset_state,
+            "targets": targets,
+            "transition": preset_transition,
+            "skip_verification": data.get(PRESET_SKIP_VERIFICATION, False),
+        }
+
+        if editing_preset_id and editing_preset_id in preset_manager.presets:
+            # Delete old preset and create new one in its place, saving once
+            async with preset_manager.batch():
+                await preset_manager.delete_preset(editing_preset_id)
+                await preset_manager.create_preset(**preset_kwargs)
+            _LOGGER.info(
+                "Updated preset: %s with %d entity configs", name, len(targets)
+            )
+        else:
+            await preset_manager.create_preset(**preset_kwargs)
+            _LOGGER.info(
+                "Created preset: %s with %d entity configs", name, len(targets)
+            )
+
+        self._clear_stored_data()
 
         # Return to menu
         return self.async_create_entry(title="", data=self.config_entry.options)
 
+    def _clear_stored_data(self) -> None:
+        """Reset the working state used while adding or editing a preset."""
+        self._preset_data.clear()
+        self._configuring_entity = None
+        self._editing_preset_id = None
+        self._deleting_preset_id = None
+
     async def async_step_manage_presets(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle managing existing presets - show menu with edit/delete options."""
-        # Get preset manager from runtime_data
-        preset_manager = None
-        if (
-            hasattr(self.config_entry, "runtime_data")
-            and self.config_entry.runtime_data
-        ):
-            preset_manager = self.config_entry.runtime_data.preset_manager
-
-        if not preset_manager or not preset_manager.presets:
+        preset_manager = self._get_preset_manager()
+        presets = preset_manager.presets if preset_manager else {}
+        if not presets:
             # No presets to manage
             return self.async_show_form(
                 step_id="manage_presets",
@@ -873,34 +816,29 @@ class LightControllerOptionsFlow(OptionsFlow):
         return self.async_show_menu(
             step_id="manage_presets",
             menu_options=["edit_preset", "delete_preset"],
-            description_placeholders={"preset_count": str(len(preset_manager.presets))},
+            description_placeholders={"preset_count": str(len(presets))},
         )
 
+    @_require_presets
     async def async_step_edit_preset(
-        self, user_input: dict[str, Any] | None = None
+        self, user_input: dict[str, Any] | None, preset_manager: PresetManager
     ) -> ConfigFlowResult:
         """Select a preset to edit."""
-        preset_manager = None
-        if (
-            hasattr(self.config_entry, "runtime_data")
-            and self.config_entry.runtime_data
-        ):
-            preset_manager = self.config_entry.runtime_data.preset_manager
-
-        if not preset_manager or not preset_manager.presets:
-            return await self.async_step_manage_presets()
+        presets = preset_manager.presets
 
         if user_input is not None:
             preset_id = user_input.get("preset_to_edit")
-            if preset_id and preset_id in preset_manager.presets:
+            if preset_id and preset_id in presets:
                 # Load preset data into editing state
-                preset = preset_manager.presets[preset_id]
+                preset = presets[preset_id]
                 self._editing_preset_id = preset_id
 
-                # Convert preset to _preset_data format for reuse of entity menu
+                # Convert preset to _preset_data format for reuse of entity menu.
+                # Entities and targets are shared with the preset, not copied:
+                # the flow replaces them rather than mutating them in place.
                 self._preset_data = {
                     PRESET_NAME: preset.name,
-                    PRESET_ENTITIES: list(preset.entities),
+                    PRESET_ENTITIES: preset.entities,
                     PRESET_SKIP_VERIFICATION: preset.skip_verification,
                     "targets": {},
                 }
@@ -909,17 +847,18 @@ class LightControllerOptionsFlow(OptionsFlow):
                 for target in preset.targets:
                     entity_id = target.get("entity_id")
                     if entity_id:
-                        self._preset_data["targets"][entity_id] = target.copy()
+                        self._preset_data["targets"][entity_id] = target
 
                 return await self.async_step_preset_entity_menu()
 
             return await self.async_step_manage_presets()
 
-        # Build preset options
-        preset_options = [
-            selector.SelectOptionDict(value=pid, label=p.name)
-            for pid, p in preset_manager.presets.items()
-        ]
+        preset_options = self._get_preset_options(
+            "edit_preset",
+            preset_manager.version,
+            presets,
+            lambda preset: preset.name,
+        )
 
         return self.async_show_form(
             step_id="edit_preset",
@@ -935,35 +874,28 @@ class LightControllerOptionsFlow(OptionsFlow):
             ),
         )
 
+    @_require_presets
     async def async_step_delete_preset(
-        self, user_input: dict[str, Any] | None = None
+        self, user_input: dict[str, Any] | None, preset_manager: PresetManager
     ) -> ConfigFlowResult:
         """Select a preset to delete."""
-        preset_manager = None
-        if (
-            hasattr(self.config_entry, "runtime_data")
-            and self.config_entry.runtime_data
-        ):
-            preset_manager = self.config_entry.runtime_data.preset_manager
-
-        if not preset_manager or not preset_manager.presets:
-            return await self.async_step_manage_presets()
+        presets = preset_manager.presets
 
         if user_input is not None:
             preset_id = user_input.get("preset_to_delete")
-            if preset_id and preset_id in preset_manager.presets:
+            if preset_id and preset_id in presets:
                 # Store for confirmation step
                 self._deleting_preset_id = preset_id
-                return await self.async_step_confirm_delete()
+                return await self.async_step_confirm_delete(None)
 
             return await self.async_step_manage_presets()
 
-        # Build preset options with entity count
-        preset_options = []
-        for pid, preset in preset_manager.presets.items():
-            entity_count = len(preset.entities)
-            label = f"{preset.name} ({entity_count} {'entity' if entity_count == 1 else 'entities'})"
-            preset_options.append(selector.SelectOptionDict(value=pid, label=label))
+        preset_options = self._get_preset_options(
+            "delete_preset",
+            preset_manager.version,
+            presets,
+            lambda preset: preset.display_label,
+        )
 
         return self.async_show_form(
             step_id="delete_preset",
@@ -979,25 +911,17 @@ class LightControllerOptionsFlow(OptionsFlow):
             ),
         )
 
+    @_require_presets
     async def async_step_confirm_delete(
-        self, user_input: dict[str, Any] | None = None
+        self, user_input: dict[str, Any] | None, preset_manager: PresetManager
     ) -> ConfigFlowResult:
         """Confirm preset deletion."""
-        preset_id = getattr(self, "_deleting_preset_id", None)
-        if not preset_id:
-            return await self.async_step_manage_presets()
-
-        preset_manager = None
-        if (
-            hasattr(self.config_entry, "runtime_data")
-            and self.config_entry.runtime_data
-        ):
-            preset_manager = self.config_entry.runtime_data.preset_manager
-
-        if not preset_manager or preset_id not in preset_manager.presets:
+        presets = preset_manager.presets
+        preset_id = self._deleting_preset_id
+        if not preset_id or preset_id not in presets:
             return await self.async_step_manage_presets()
 
-        preset = preset_manager.presets[preset_id]
+        preset = presets[preset_id]
 
         if user_input is not None:
             if user_input.get("confirm_delete"):
@@ -1014,9 +938,7 @@ class LightControllerOptionsFlow(OptionsFlow):
             step_id="confirm_delete",
             data_schema=vol.Schema(
                 {
-                    vol.Required(
-                        "confirm_delete", default=False
-                    ): selector.BooleanSelector(),
+                    vol.Required("confirm_delete", default=False): _BOOLEAN_SELECTOR,
                 }
             ),
             description_placeholders={
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
+from collections.abc import Collection, Mapping, Sequence
 from dataclasses import dataclass, field
-from enum import Enum
-from time import monotonic
-from typing import Any
+from enum import Enum, StrEnum
+from time import monotonic_ns
+from types import MappingProxyType
+from typing import Any, cast
 
 from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, State
@@ -33,14 +36,14 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 LIGHT_DOMAIN = "light"
+LIGHT_PREFIX = f"{LIGHT_DOMAIN}."
+_EMPTY_ATTRIBUTES: Mapping[str, Any] = MappingProxyType({})
+NS_PER_SECOND = 1_000_000_000
+# States that mean an entity cannot currently be controlled or verified
+UNAVAILABLE_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN})
 
-type GroupTransitionKey = tuple[
-    int,
-    tuple[int, ...] | None,
-    int | None,
-    str | None,
-    float | None,
-]
+type SettingsKey = tuple[int, tuple[int, ...] | None, int | None, str | None]
+type GroupTransitionKey = tuple[SettingsKey, float | None]
 
 
 # =============================================================================
@@ -48,19 +51,19 @@ type GroupTransitionKey = tuple[
 # =============================================================================
 
 
-class TargetState(Enum):
+class TargetState(StrEnum):
     """Target state for lights."""
 
     ON = "on"
     OFF = "off"
 
     @classmethod
-    def from_string(cls, value: str) -> TargetState:
-        """Parse a string into a TargetState enum value."""
-        normalized = value.lower().strip()
-        for state in cls:
-            if state.value == normalized:
-                return state
+    def _missing_(cls, value: object) -> TargetState:
+        """Accept any case and surrounding whitespace, e.g. TargetState(" ON ")."""
+        if isinstance(value, str):
+            member = cls._value2member_map_.get(value.strip().lower())
+            if member is not None:
+                return cast(TargetState, member)
         raise ValueError(f"Invalid state '{value}'. Must be 'on' or 'off'.")
 
 
@@ -75,12 +78,18 @@ class VerificationResult(Enum):
     ERROR = "error"
 
 
+# Verification results that need no further attempts
+RESOLVED_RESULTS = frozenset(
+    {VerificationResult.SUCCESS, VerificationResult.UNAVAILABLE}
+)
+
+
 # =============================================================================
 # DATACLASSES
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorTolerance:
     """Tolerance configuration for color verification."""
 
@@ -89,7 +98,7 @@ class ColorTolerance:
     kelvin: int = 150
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryConfig:
     """Configuration for retry behavior."""
 
@@ -106,19 +115,25 @@ class RetryConfig:
             return float(min(delay, self.max_backoff_seconds))
         return self.delay_after_send
 
+    def delay_schedule(self) -> tuple[float, ...]:
+        """Return the post-send delay for every attempt, indexed by attempt."""
+        return tuple(
+            self.calculate_delay(attempt) for attempt in range(int(self.max_retries))
+        )
+
 
 class LightSettingsMixin:
     """Mixin providing shared to_service_data() for light settings."""
 
+    __slots__ = ()
+
     brightness_pct: int
-    rgb_color: list[int] | None
+    rgb_color: Sequence[int] | None
     color_temp_kelvin: int | None
     effect: str | None
 
-    def to_service_data(
-        self, include_transition: float | None = None
-    ) -> dict[str, Any]:
-        """Convert to service call data."""
+    def _settings_data(self) -> dict[str, Any]:
+        """Build the brightness, color and effect part of the service data."""
         data: dict[str, Any] = {"brightness_pct": self.brightness_pct}
 
         if self.rgb_color is not None:
@@ -129,37 +144,72 @@ class LightSettingsMixin:
         if self.effect is not None:
             data["effect"] = self.effect
 
-        if include_transition is not None and include_transition > 0:
+        return data
+
+    def to_service_data(self, include_transition: float = 0.0) -> dict[str, Any]:
+        """Convert to service call data."""
+        data = self._settings_data()
+
+        if include_transition > 0:
             data["transition"] = include_transition
 
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class LightTarget(LightSettingsMixin):
     """Target settings for a single light."""
 
     entity_id: str
     brightness_pct: int = 100
-    rgb_color: list[int] | None = None
+    rgb_color: tuple[int, ...] | None = None
     color_temp_kelvin: int | None = None
     effect: str | None = None
     state: str = "on"
     transition: float | None = None
+    settings_key: SettingsKey = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Intern the entity id, store the color as a tuple and build the key."""
+        self.entity_id = sys.intern(self.entity_id)
+        rgb_color = self.rgb_color
+        if rgb_color is not None:
+            # tuple() returns tuples unchanged, so only lists get copied
+            rgb_color = self.rgb_color = tuple(rgb_color)
+        self.settings_key = (
+            self.brightness_pct,
+            rgb_color or None,
+            self.color_temp_kelvin,
+            self.effect,
+        )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LightGroup(LightSettingsMixin):
     """A group of lights with identical settings for batched commands."""
 
-    entities: list[str]
+    entities: tuple[str, ...]
     brightness_pct: int
-    rgb_color: list[int] | None = None
+    rgb_color: Sequence[int] | None = None
     color_temp_kelvin: int | None = None
     effect: str | None = None
+    _settings: dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Intern member ids and build the settings payload once."""
+        object.__setattr__(
+            self, "entities", tuple(sys.intern(e) for e in self.entities)
+        )
+        object.__setattr__(self, "_settings", self._settings_data())
+
+    def to_service_data(self, include_transition: float = 0.0) -> dict[str, Any]:
+        """Convert to service call data from the prebuilt settings payload."""
+        if include_transition > 0:
+            return {**self._settings, "transition": include_transition}
+        return self._settings.copy()
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationResult:
     """Result of the ensure state operation."""
 
@@ -168,8 +218,8 @@ class OperationResult:
     message: str
     attempts: int = 0
     total_lights: int = 0
-    failed_lights: list[str] = field(default_factory=list)
-    skipped_lights: list[str] = field(default_factory=list)
+    failed_lights: list[str] | None = None
+    skipped_lights: list[str] | None = None
     elapsed_seconds: float = 0.0
 
     def to_dict(self) -> dict[str, Any]:
@@ -180,8 +230,8 @@ class OperationResult:
             RESULT_MESSAGE: self.message,
             RESULT_ATTEMPTS: self.attempts,
             RESULT_TOTAL_LIGHTS: self.total_lights,
-            RESULT_FAILED_LIGHTS: self.failed_lights,
-            RESULT_SKIPPED_LIGHTS: self.skipped_lights,
+            RESULT_FAILED_LIGHTS: self.failed_lights or [],
+            RESULT_SKIPPED_LIGHTS: self.skipped_lights or [],
             RESULT_ELAPSED_SECONDS: round(self.elapsed_seconds, 2),
         }
 
@@ -206,13 +256,15 @@ class LightController:
         """Get entity state object."""
         return self.hass.states.get(entity_id)
 
+    def _get_attributes(self, entity_id: str) -> Mapping[str, Any]:
+        """Get entity state attributes, empty if the entity has no state."""
+        state = self._get_state(entity_id)
+        return state.attributes if state else _EMPTY_ATTRIBUTES
+
     def _is_available(self, entity_id: str) -> bool:
         """Check if entity is available."""
         state = self._get_state(entity_id)
-        return state is not None and state.state not in [
-            STATE_UNAVAILABLE,
-            STATE_UNKNOWN,
-        ]
+        return state is not None and state.state not in UNAVAILABLE_STATES
 
     # =========================================================================
     # Entity Expansion
@@ -231,9 +283,7 @@ class LightController:
             _LOGGER.warning("Invalid entity_id type: %s", type(entity_id).__name__)
             return valid, skipped
 
-        state = self._get_state(entity_id)
-        attrs = dict(state.attributes) if state else {}
-        members = attrs.get("entity_id", [])
+        members = self._get_attributes(entity_id).get("entity_id", [])
 
         # Case 1: Entity has member entities (light group or group.* helper)
         if isinstance(members, (list, tuple)) and members:
@@ -241,7 +291,7 @@ class LightController:
             for member in members:
                 if not isinstance(member, str):
                     continue
-                if not member.startswith(f"{LIGHT_DOMAIN}."):
+                if not member.startswith(LIGHT_PREFIX):
                     continue
                 if self._is_available(member):
                     valid.append(member)
@@ -249,7 +299,7 @@ class LightController:
                     skipped.append(member)
 
         # Case 2: Individual light
-        elif entity_id.startswith(f"{LIGHT_DOMAIN}."):
+        elif entity_id.startswith(LIGHT_PREFIX):
             if self._is_available(entity_id):
                 valid.append(entity_id)
             else:
@@ -266,17 +316,30 @@ class LightController:
 
         Returns: (members, skipped)
         """
-        all_valid: list[str] = []
-        all_skipped: list[str] = []
+        unique_valid: list[str] = []
+        unique_skipped: list[str] = []
+        seen_valid: set[str] = set()
+        seen_skipped: set[str] = set()
+
+        # Repeated inputs expand identically, so each one is expanded only once
+        expanded: set[str] = set()
 
         for entity_id in entities:
+            if isinstance(entity_id, str):
+                if entity_id in expanded:
+                    continue
+                expanded.add(entity_id)
             valid, skipped = self._expand_entity(entity_id)
-            all_valid.extend(valid)
-            all_skipped.extend(skipped)
 
-        # Deduplicate while preserving order
-        unique_valid = list(dict.fromkeys(all_valid))
-        unique_skipped = list(dict.fromkeys(all_skipped))
+            # Deduplicate while preserving order
+            for member in valid:
+                if member not in seen_valid:
+                    seen_valid.add(member)
+                    unique_valid.append(member)
+            for member in skipped:
+                if member not in seen_skipped:
+                    seen_skipped.add(member)
+                    unique_skipped.append(member)
 
         _LOGGER.debug(
             "Expanded to %d valid lights, %d skipped",
@@ -303,6 +366,7 @@ class LightController:
     ) -> list[LightTarget]:
         """Build LightTarget objects for each member."""
         targets: list[LightTarget] = []
+        default_rgb = None if default_rgb_color is None else tuple(default_rgb_color)
 
         for entity_id in members:
             override = overrides.get(entity_id, {})
@@ -310,7 +374,7 @@ class LightController:
             target = LightTarget(
                 entity_id=entity_id,
                 brightness_pct=override.get("brightness_pct", default_brightness_pct),
-                rgb_color=override.get("rgb_color", default_rgb_color),
+                rgb_color=override.get("rgb_color", default_rgb),
                 color_temp_kelvin=override.get(
                     "color_temp_kelvin",
                     override.get("color_temperature_kelvin", default_color_temp_kelvin),
@@ -328,11 +392,15 @@ class LightController:
     # =========================================================================
 
     def _verify_brightness(
-        self, entity_id: str, expected_pct: int, tolerance: int
+        self,
+        entity_id: str,
+        expected_pct: int,
+        tolerance: int,
+        attrs: Mapping[str, Any] | None = None,
     ) -> bool:
         """Verify brightness is within tolerance."""
-        state = self._get_state(entity_id)
-        attrs = dict(state.attributes) if state else {}
+        if attrs is None:
+            attrs = self._get_attributes(entity_id)
         raw_brightness = attrs.get("brightness") or 0
         actual_pct = round((raw_brightness / 255) * 100)
 
@@ -340,27 +408,35 @@ class LightController:
             (expected_pct - tolerance) <= actual_pct <= (expected_pct + tolerance)
         )
 
-        _LOGGER.debug(
-            "%s brightness: expected=%d%%, actual=%d%%, tolerance=±%d%%, match=%s",
-            entity_id,
-            expected_pct,
-            actual_pct,
-            tolerance,
-            within_tolerance,
-        )
+        # Runs per target per attempt; skip building the log call when debug is off
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s brightness: expected=%d%%, actual=%d%%, tolerance=±%d%%, match=%s",
+                entity_id,
+                expected_pct,
+                actual_pct,
+                tolerance,
+                within_tolerance,
+            )
 
         return within_tolerance
 
     def _verify_rgb(
-        self, entity_id: str, expected_rgb: list[int] | None, tolerance: int
+        self,
+        entity_id: str,
+        expected_rgb: Sequence[int] | None,
+        tolerance: int,
+        attrs: Mapping[str, Any] | None = None,
+        supported_modes: Collection[str] | None = None,
     ) -> bool | None:
         """Verify RGB color is within tolerance."""
         if expected_rgb is None:
             return None
 
-        state = self._get_state(entity_id)
-        attrs = dict(state.attributes) if state else {}
-        supported_modes = attrs.get("supported_color_modes", []) or []
+        if attrs is None:
+            attrs = self._get_attributes(entity_id)
+        if supported_modes is None:
+            supported_modes = attrs.get("supported_color_modes") or ()
         supports_rgb = (
             COLOR_MODE_RGB in supported_modes or COLOR_MODE_HS in supported_modes
         )
@@ -376,31 +452,40 @@ class LightController:
         ):
             return False
 
-        for i, (expected, actual) in enumerate(
-            zip(expected_rgb, actual_rgb, strict=False)
+        expected_r, expected_g, expected_b = expected_rgb
+        actual_r, actual_g, actual_b = actual_rgb
+        if (
+            abs(expected_r - actual_r) > tolerance
+            or abs(expected_g - actual_g) > tolerance
+            or abs(expected_b - actual_b) > tolerance
         ):
-            if not ((expected - tolerance) <= actual <= (expected + tolerance)):
-                _LOGGER.debug(
-                    "%s RGB channel %d: expected=%d, actual=%d, MISMATCH",
-                    entity_id,
-                    i,
-                    expected,
-                    actual,
-                )
-                return False
+            _LOGGER.debug(
+                "%s RGB: expected=%s, actual=%s, tolerance=±%d, MISMATCH",
+                entity_id,
+                expected_rgb,
+                actual_rgb,
+                tolerance,
+            )
+            return False
 
         return True
 
     def _verify_kelvin(
-        self, entity_id: str, expected_kelvin: int | None, tolerance: int
+        self,
+        entity_id: str,
+        expected_kelvin: int | None,
+        tolerance: int,
+        attrs: Mapping[str, Any] | None = None,
+        supported_modes: Collection[str] | None = None,
     ) -> bool | None:
         """Verify color temperature is within tolerance."""
         if expected_kelvin is None:
             return None
 
-        state = self._get_state(entity_id)
-        attrs = dict(state.attributes) if state else {}
-        supported_modes = attrs.get("supported_color_modes", []) or []
+        if attrs is None:
+            attrs = self._get_attributes(entity_id)
+        if supported_modes is None:
+            supported_modes = attrs.get("supported_color_modes") or ()
 
         if COLOR_MODE_COLOR_TEMP not in supported_modes:
             return None
@@ -432,11 +517,11 @@ class LightController:
 
         try:
             state = self._get_state(entity_id)
-            current_state = state.state if state else None
-
-            if current_state in [None, STATE_UNAVAILABLE, STATE_UNKNOWN]:
+            if state is None or state.state in UNAVAILABLE_STATES:
                 return VerificationResult.UNAVAILABLE
 
+            current_state = state.state
+
             if target_state == TargetState.OFF:
                 return (
                     VerificationResult.SUCCESS
@@ -448,8 +533,10 @@ class LightController:
             if current_state != STATE_ON:
                 return VerificationResult.WRONG_STATE
 
+            # Reuse the fetched state's attributes for every check below
+            attrs = state.attributes
             if not self._verify_brightness(
-                entity_id, target.brightness_pct, tolerances.brightness
+                entity_id, target.brightness_pct, tolerances.brightness, attrs
             ):
                 return VerificationResult.WRONG_BRIGHTNESS
 
@@ -460,9 +547,16 @@ class LightController:
             if not has_rgb and not has_kelvin:
                 return VerificationResult.SUCCESS
 
-            rgb_result = self._verify_rgb(entity_id, target.rgb_color, tolerances.rgb)
+            supported_modes = attrs.get("supported_color_modes") or ()
+            rgb_result = self._verify_rgb(
+                entity_id, target.rgb_color, tolerances.rgb, attrs, supported_modes
+            )
             kelvin_result = self._verify_kelvin(
-                entity_id, target.color_temp_kelvin, tolerances.kelvin
+                entity_id,
+                target.color_temp_kelvin,
+                tolerances.kelvin,
+                attrs,
+                supported_modes,
             )
 
             # OK if matches (True) or unsupported (None); only False is a failure
@@ -495,14 +589,12 @@ class LightController:
         except Exception as e:
             _LOGGER.error("Error sending turn_off: %s", e)
 
-    async def _send_turn_on(
-        self, group: LightGroup, transition: float | None = None
-    ) -> None:
+    async def _send_turn_on(self, group: LightGroup, transition: float = 0.0) -> None:
         """Send turn_on command to a light group."""
         _LOGGER.debug("Sending turn_on to %d lights", len(group.entities))
         try:
             service_data = group.to_service_data(include_transition=transition)
-            service_data["entity_id"] = group.entities
+            service_data["entity_id"] = list(group.entities)
             await self.hass.services.async_call(
                 LIGHT_DOMAIN,
                 "turn_on",
@@ -517,16 +609,21 @@ class LightController:
         targets: list[LightTarget],
         global_transition: float | None = None,
         use_target_transitions: bool = True,
-    ) -> None:
+    ) -> list[list[LightTarget]]:
         """Send commands to targets, respecting per-entity state and transition.
 
         This method splits targets by state (on/off) and sends appropriate commands.
         Per-entity transition takes precedence over global_transition.
+
+        Returns the targets of each command sent, one batch per service call.
         """
         on_targets = [t for t in targets if t.state == "on"]
         off_targets = [t for t in targets if t.state == "off"]
+        batches: list[list[LightTarget]] = []
 
         if off_targets:
+            # OFF targets are always sent as a single batched turn_off call.
+            batches.append(off_targets)
             off_entities = [t.entity_id for t in off_targets]
             await self._send_turn_off(off_entities)
 
@@ -536,10 +633,20 @@ class LightController:
                 global_transition,
                 use_target_transitions=use_target_transitions,
             )
-            tasks = [
-                self._send_turn_on(group, transition) for group, transition, _ in groups
-            ]
-            await asyncio.gather(*tasks)
+            batches.extend(group_targets for _, _, group_targets in groups)
+            if len(groups) == 1:
+                # Common case: one settings group, no need for tasks or gather
+                group, transition, _ = groups[0]
+                await self._send_turn_on(group, transition or 0.0)
+            else:
+                await asyncio.gather(
+                    *(
+                        self._send_turn_on(group, transition or 0.0)
+                        for group, transition, _ in groups
+                    )
+                )
+
+        return batches
 
     def _group_by_settings_with_transition(
         self,
@@ -548,9 +655,7 @@ class LightController:
         use_target_transitions: bool = True,
     ) -> list[tuple[LightGroup, float | None, list[LightTarget]]]:
         """Group targets by settings, returning groups with transition and members."""
-        groups: dict[
-            GroupTransitionKey, tuple[LightGroup, float | None, list[LightTarget]]
-        ] = {}
+        members_by_key: dict[GroupTransitionKey, list[LightTarget]] = {}
 
         for target in targets:
             transition = (
@@ -559,55 +664,28 @@ class LightController:
                 else global_transition
             )
 
-            rgb_key = tuple(target.rgb_color) if target.rgb_color else None
-            key = (
-                target.brightness_pct,
-                rgb_key,
-                target.color_temp_kelvin,
-                target.effect,
-                transition,
-            )
+            key = (target.settings_key, transition)
 
-            if key not in groups:
-                group = LightGroup(
-                    entities=[target.entity_id],
-                    brightness_pct=target.brightness_pct,
-                    rgb_color=target.rgb_color,
-                    color_temp_kelvin=target.color_temp_kelvin,
-                    effect=target.effect,
-                )
-                groups[key] = (group, transition, [target])
+            members = members_by_key.get(key)
+            if members is None:
+                members_by_key[key] = [target]
             else:
-                groups[key][0].entities.append(target.entity_id)
-                groups[key][2].append(target)
-
-        return list(groups.values())
-
-    def _build_dispatch_batches(
-        self,
-        targets: list[LightTarget],
-        global_transition: float | None = None,
-        use_target_transitions: bool = True,
-    ) -> list[list[LightTarget]]:
-        """Build command batches matching the current dispatch strategy."""
-        batches: list[list[LightTarget]] = []
-        off_targets = [t for t in targets if t.state == "off"]
-        on_targets = [t for t in targets if t.state == "on"]
-
-        if off_targets:
-            # OFF targets are always sent as a single batched turn_off call.
-            batches.append(off_targets)
-
-        if on_targets:
-            grouped_on = self._group_by_settings_with_transition(
-                on_targets,
-                global_transition,
-                use_target_transitions=use_target_transitions,
+                members.append(target)
+
+        # Groups are immutable, so build each one once its members are known
+        result: list[tuple[LightGroup, float | None, list[LightTarget]]] = []
+        for (_, transition), members in members_by_key.items():
+            first = members[0]
+            group = LightGroup(
+                entities=tuple(t.entity_id for t in members),
+                brightness_pct=first.brightness_pct,
+                rgb_color=first.rgb_color,
+                color_temp_kelvin=first.color_temp_kelvin,
+                effect=first.effect,
             )
-            for _, _, group_targets in grouped_on:
-                batches.append(group_targets)
+            result.append((group, transition, members))
 
-        return batches
+        return result
 
     # =========================================================================
     # Logging and Notifications
@@ -649,13 +727,17 @@ class LightController:
         max_backoff_seconds: float = 30,
         skip_verification: bool = False,
         log_success: bool = False,
+        tolerances: ColorTolerance | None = None,
+        retry_config: RetryConfig | None = None,
     ) -> dict[str, Any]:
         """
         Ensure lights reach target state with verification and retries.
 
-        This is the main entry point for the controller.
+        This is the main entry point for the controller. Prebuilt
+        ``tolerances`` / ``retry_config`` take precedence over the scalar
+        tolerance and retry arguments.
         """
-        script_start = monotonic()
+        start_ns = monotonic_ns()
 
         _LOGGER.info(
             "Starting ensure_state with %d entities", len(entities) if entities else 0
@@ -675,7 +757,7 @@ class LightController:
             ).to_dict()
 
         try:
-            target_state = TargetState.from_string(state_target)
+            target_state = TargetState(state_target)
         except ValueError as e:
             message = str(e)
             _LOGGER.error(message)
@@ -683,19 +765,21 @@ class LightController:
                 success=False, result_code=RESULT_CODE_ERROR, message=message
             ).to_dict()
 
-        tolerances = ColorTolerance(
-            brightness=brightness_tolerance,
-            rgb=rgb_tolerance,
-            kelvin=kelvin_tolerance,
-        )
+        if tolerances is None:
+            tolerances = ColorTolerance(
+                brightness=brightness_tolerance,
+                rgb=rgb_tolerance,
+                kelvin=kelvin_tolerance,
+            )
 
-        retry_config = RetryConfig(
-            max_retries=max_retries,
-            delay_after_send=float(delay_after_send),
-            max_runtime_seconds=float(max_runtime_seconds),
-            use_exponential_backoff=use_exponential_backoff,
-            max_backoff_seconds=float(max_backoff_seconds),
-        )
+        if retry_config is None:
+            retry_config = RetryConfig(
+                max_retries=int(max_retries),
+                delay_after_send=float(delay_after_send),
+                max_runtime_seconds=float(max_runtime_seconds),
+                use_exponential_backoff=use_exponential_backoff,
+                max_backoff_seconds=float(max_backoff_seconds),
+            )
 
         # Expand entities
         members, skipped_entities = self._expand_entities(list(entities))
@@ -713,7 +797,7 @@ class LightController:
                 skipped_lights=skipped_entities,
             ).to_dict()
 
-        if skipped_entities:
+        if skipped_entities and _LOGGER.isEnabledFor(logging.INFO):
             _LOGGER.info(
                 "Skipped %d unavailable entities: %s",
                 len(skipped_entities),
@@ -721,11 +805,11 @@ class LightController:
             )
 
         # Build overrides dict
-        overrides: dict[str, dict[str, Any]] = {}
-        if targets:
-            for t in targets:
-                if isinstance(t, dict) and "entity_id" in t:
-                    overrides[t["entity_id"]] = t
+        overrides: dict[str, dict[str, Any]] = {
+            t["entity_id"]: t
+            for t in targets or ()
+            if isinstance(t, dict) and "entity_id" in t
+        }
 
         # Build targets
         pending_targets = self._build_targets(
@@ -748,7 +832,7 @@ class LightController:
                 use_target_transitions=True,
             )
 
-            elapsed = monotonic() - script_start
+            elapsed = (monotonic_ns() - start_ns) / NS_PER_SECOND
 
             if log_success:
                 await self._log_to_logbook(
@@ -767,14 +851,20 @@ class LightController:
 
         # Main retry loop
         attempt = 0
+        delays = retry_config.delay_schedule()
+        deadline_ns = start_ns + int(retry_config.max_runtime_seconds * NS_PER_SECOND)
+        # Target states never change between attempts, so parse them once
+        target_states = {t.entity_id: TargetState(t.state) for t in pending_targets}
 
         while pending_targets and attempt < retry_config.max_retries:
-            elapsed = monotonic() - script_start
-            if elapsed >= retry_config.max_runtime_seconds:
-                _LOGGER.warning("Timeout reached after %.1fs", elapsed)
+            now_ns = monotonic_ns()
+            if now_ns >= deadline_ns:
+                _LOGGER.warning(
+                    "Timeout reached after %.1fs", (now_ns - start_ns) / NS_PER_SECOND
+                )
                 break
 
-            current_delay = retry_config.calculate_delay(attempt)
+            current_delay = delays[attempt]
 
             _LOGGER.info(
                 "Attempt %d/%d: %d lights pending",
@@ -789,7 +879,7 @@ class LightController:
             if target_state == TargetState.ON and attempt == 0 and transition > 0:
                 use_transition = transition
 
-            await self._send_commands_per_target(
+            dispatch_batches = await self._send_commands_per_target(
                 pending_targets,
                 global_transition=use_transition,
                 use_target_transitions=use_target_transitions,
@@ -799,24 +889,18 @@ class LightController:
 
             # Verify and filter at dispatch-batch granularity.
             # If any target in a batch fails verification, the full batch is retried.
-            dispatch_batches = self._build_dispatch_batches(
-                pending_targets,
-                global_transition=use_transition,
-                use_target_transitions=use_target_transitions,
-            )
             verification_results: dict[str, VerificationResult] = {}
             for target in pending_targets:
                 verification_results[target.entity_id] = self._verify_light(
                     target,
-                    TargetState.from_string(target.state),
+                    target_states[target.entity_id],
                     tolerances,
                 )
 
             still_pending: list[LightTarget] = []
             for batch in dispatch_batches:
                 if any(
-                    verification_results[t.entity_id]
-                    not in [VerificationResult.SUCCESS, VerificationResult.UNAVAILABLE]
+                    verification_results[t.entity_id] not in RESOLVED_RESULTS
                     for t in batch
                 ):
                     # Don't retry entities that are unavailable.
@@ -832,8 +916,7 @@ class LightController:
             resolved_count = sum(
                 1
                 for result in verification_results.values()
-                if result
-                in [VerificationResult.SUCCESS, VerificationResult.UNAVAILABLE]
+                if result in RESOLVED_RESULTS
             )
 
             _LOGGER.debug(
@@ -846,11 +929,12 @@ class LightController:
             attempt += 1
 
         # Handle results
-        elapsed = monotonic() - script_start
-        failed_entities = [t.entity_id for t in pending_targets]
+        end_ns = monotonic_ns()
+        elapsed = (end_ns - start_ns) / NS_PER_SECOND
 
         # Timeout
-        if elapsed >= retry_config.max_runtime_seconds and pending_targets:
+        if end_ns >= deadline_ns and pending_targets:
+            failed_entities = [t.entity_id for t in pending_targets]
             message = (
                 f"Timeout after {retry_config.max_runtime_seconds}s. "
                 f"Failed: {', '.join(failed_entities)}"
@@ -871,6 +955,7 @@ class LightController:
 
         # Failure after retries
         if pending_targets:
+            failed_entities = [t.entity_id for t in pending_targets]
             message = f"Failed after {attempt} attempts. Remaining: {', '.join(failed_entities)}"
             _LOGGER.error(message)
             await self._log_to_logbook("Light Controller", message)
@@ -4,18 +4,18 @@ from __future__ import annotations
 
 import logging
 import uuid
-from collections.abc import Callable, Mapping
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from itertools import count
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 
-if TYPE_CHECKING:
-    from .controller import LightController
-
 from .const import (
     CONF_BRIGHTNESS_TOLERANCE,
     CONF_DELAY_AFTER_SEND,
@@ -36,6 +36,7 @@ from .const import (
     DEFAULT_MAX_RUNTIME_SECONDS,
     DEFAULT_RGB_TOLERANCE,
     DEFAULT_USE_EXPONENTIAL_BACKOFF,
+    DOMAIN,
     PRESET_BRIGHTNESS_PCT,
     PRESET_COLOR_TEMP_KELVIN,
     PRESET_EFFECT,
@@ -51,13 +52,26 @@ from .const import (
     PRESET_TARGETS,
     PRESET_TRANSITION,
 )
+from .controller import ColorTolerance, RetryConfig
+
+if TYPE_CHECKING:
+    from .controller import LightController
 
 _LOGGER = logging.getLogger(__name__)
 
 type PresetListener = Callable[[], None]
 
+# Effect values that mean no effect is running
+_NO_EFFECTS = frozenset({None, "none", "None"})
+
+# (platform, unique_id suffix) of the entities created for each preset
+_PRESET_ENTITY_PLATFORMS: tuple[tuple[str, str], ...] = (
+    ("button", "_button"),
+    ("sensor", "_status"),
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class PresetConfig:
     """Configuration for a single preset."""
 
@@ -72,27 +86,65 @@ class PresetConfig:
     targets: list[dict[str, Any]] = field(default_factory=list)
     transition: float = 0.0
     skip_verification: bool = False
+    _cached_dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_label: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field and drop cached views built from the old value."""
+        object.__setattr__(self, name, value)
+        if not name.startswith("_cached_"):
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop cached views; call after editing a list field in place."""
+        object.__setattr__(self, "_cached_dict", None)
+        object.__setattr__(self, "_cached_label", None)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> PresetConfig:
         """Create a PresetConfig from a dictionary."""
+        preset_id = data.get(PRESET_ID)
+        if preset_id is None:
+            preset_id = str(uuid.uuid4())
+
         return cls(
-            id=data.get(PRESET_ID, str(uuid.uuid4())),
+            id=preset_id,
             name=data.get(PRESET_NAME, "Unnamed Preset"),
-            entities=data.get(PRESET_ENTITIES, []),
+            # Shallow copies keep the preset from sharing lists with entry.data
+            entities=list(data.get(PRESET_ENTITIES, [])),
             state=data.get(PRESET_STATE, "on"),
             brightness_pct=data.get(PRESET_BRIGHTNESS_PCT, 100),
             rgb_color=data.get(PRESET_RGB_COLOR),
             color_temp_kelvin=data.get(PRESET_COLOR_TEMP_KELVIN),
             effect=data.get(PRESET_EFFECT),
-            targets=data.get(PRESET_TARGETS, []),
+            targets=[dict(target) for target in data.get(PRESET_TARGETS, [])],
             transition=data.get(PRESET_TRANSITION, 0.0),
             skip_verification=data.get(PRESET_SKIP_VERIFICATION, False),
         )
 
+    @property
+    def display_label(self) -> str:
+        """Return the label shown when selecting this preset in the options flow."""
+        if self._cached_label is None:
+            count = len(self.entities)
+            self._cached_label = (
+                f"{self.name} ({count} {'entity' if count == 1 else 'entities'})"
+            )
+        return self._cached_label
+
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for storage."""
-        return {
+        """Convert to dictionary for storage.
+
+        The dict is reused by later saves until a field changes.
+        """
+        if self._cached_dict is not None:
+            return self._cached_dict
+
+        self._cached_dict = {
             PRESET_ID: self.id,
             PRESET_NAME: self.name,
             PRESET_ENTITIES: self.entities,
@@ -105,9 +157,10 @@ class PresetConfig:
             PRESET_TRANSITION: self.transition,
             PRESET_SKIP_VERIFICATION: self.skip_verification,
         }
+        return self._cached_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class PresetStatus:
     """Runtime status of a preset."""
 
@@ -116,6 +169,11 @@ class PresetStatus:
     last_activated: str | None = None
 
 
+# Shared by all managers so a manager rebuilt on entry reload never reports
+# a version an earlier manager already handed out
+_VERSIONS = count()
+
+
 class PresetManager:
     """Manages preset storage and operations."""
 
@@ -124,8 +182,19 @@ class PresetManager:
         self.hass = hass
         self.entry = entry
         self._presets: dict[str, PresetConfig] = {}
+        self._presets_view = MappingProxyType(self._presets)
+        # Lowercased name -> id of the first preset with that name
+        self._name_index: dict[str, str] = {}
         self._status: dict[str, PresetStatus] = {}
-        self._listeners: list[PresetListener] = []
+        self._listeners: dict[int, PresetListener] = {}
+        self._preset_listeners: dict[str, dict[int, PresetListener]] = {}
+        self._listener_tokens = count()
+        self._version = next(_VERSIONS)
+        self._save_depth = 0
+        self._save_pending = False
+        self._option_configs: (
+            tuple[Mapping[str, Any], ColorTolerance, RetryConfig, bool] | None
+        ) = None
 
         # Load presets from config entry
         self._load_presets()
@@ -135,10 +204,16 @@ class PresetManager:
         presets_data = self.entry.data.get(CONF_PRESETS, {})
 
         for preset_id, preset_data in presets_data.items():
+            if not isinstance(preset_data, dict):
+                _LOGGER.error(
+                    "Skipping preset %s: stored data is not a dict", preset_id
+                )
+                continue
+
             try:
                 preset = PresetConfig.from_dict(preset_data)
                 self._presets[preset_id] = preset
-                self._status[preset_id] = PresetStatus()
+                self._name_index.setdefault(preset.name.lower(), preset_id)
                 _LOGGER.debug("Loaded preset: %s (%s)", preset.name, preset_id)
             except Exception as e:
                 _LOGGER.error("Error loading preset %s: %s", preset_id, e)
@@ -146,13 +221,24 @@ class PresetManager:
         _LOGGER.info("Loaded %d presets", len(self._presets))
 
     async def _save_presets(self) -> None:
-        """Save presets to config entry data."""
+        """Save presets to config entry data, or defer it inside a batch."""
+        if self._save_depth:
+            self._save_pending = True
+            return
+
         presets_data = {
             preset_id: preset.to_dict() for preset_id, preset in self._presets.items()
         }
+        if self.entry.data.get(CONF_PRESETS) == presets_data:
+            _LOGGER.debug("Presets unchanged, skipping save")
+            return
 
-        # Update config entry data
-        new_data = {**self.entry.data, CONF_PRESETS: presets_data}
+        self._version = next(_VERSIONS)
+
+        # Update config entry data; a fresh presets dict is required so
+        # async_update_entry sees the change
+        new_data = self.entry.data.copy()
+        new_data[CONF_PRESETS] = presets_data
         self.hass.config_entries.async_update_entry(self.entry, data=new_data)
 
         _LOGGER.debug("Saved %d presets", len(presets_data))
@@ -160,11 +246,39 @@ class PresetManager:
         # Notify listeners
         await self._notify_listeners()
 
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Group preset changes so they are saved once when the batch exits."""
+        self._save_depth += 1
+        try:
+            yield
+        finally:
+            self._save_depth -= 1
+            if not self._save_depth and self._save_pending:
+                self._save_pending = False
+                await self._save_presets()
+
     async def _notify_listeners(self) -> None:
-        """Notify all registered listeners of preset changes."""
-        # Create a snapshot to avoid issues if listeners modify the list during iteration
-        listeners_snapshot = list(self._listeners)
-        for listener in listeners_snapshot:
+        """Notify all registered listeners that the set of presets changed."""
+        if not self._listeners and not self._preset_listeners:
+            return
+
+        # Create a snapshot to avoid issues if listeners unsubscribe during iteration
+        listeners_snapshot = list(self._listeners.values())
+        for preset_listeners in self._preset_listeners.values():
+            listeners_snapshot.extend(preset_listeners.values())
+        self._call_listeners(listeners_snapshot)
+
+    def _notify_preset_listeners(self, preset_id: str) -> None:
+        """Notify only the listeners registered for one preset."""
+        preset_listeners = self._preset_listeners.get(preset_id)
+        if preset_listeners:
+            self._call_listeners(list(preset_listeners.values()))
+
+    @staticmethod
+    def _call_listeners(listeners: list[PresetListener]) -> None:
+        """Call each listener, logging failures without stopping the others."""
+        for listener in listeners:
             try:
                 listener()
             except Exception as e:
@@ -173,17 +287,48 @@ class PresetManager:
     @callback
     def register_listener(self, listener: PresetListener) -> Callable[[], None]:
         """Register a listener for preset changes. Returns unsubscribe function."""
-        self._listeners.append(listener)
+        token = next(self._listener_tokens)
+        self._listeners[token] = listener
 
         def unsubscribe() -> None:
-            if listener in self._listeners:
-                self._listeners.remove(listener)
+            self._listeners.pop(token, None)
+
+        return unsubscribe
+
+    @callback
+    def register_preset_listener(
+        self, preset_id: str, listener: PresetListener
+    ) -> Callable[[], None]:
+        """Register a listener for one preset's changes. Returns unsubscribe function.
+
+        Preset listeners are called when that preset's status changes and on
+        every save; status changes of other presets do not reach them.
+        """
+        token = next(self._listener_tokens)
+        self._preset_listeners.setdefault(preset_id, {})[token] = listener
+
+        def unsubscribe() -> None:
+            preset_listeners = self._preset_listeners.get(preset_id)
+            if preset_listeners is None:
+                return
+            preset_listeners.pop(token, None)
+            if not preset_listeners:
+                del self._preset_listeners[preset_id]
 
         return unsubscribe
 
     @property
-    def presets(self) -> dict[str, PresetConfig]:
-        """Get all presets."""
+    def version(self) -> int:
+        """Return a process-wide counter that changes whenever presets are saved."""
+        return self._version
+
+    @property
+    def presets(self) -> Mapping[str, PresetConfig]:
+        """Get a read-only live view of all presets."""
+        return self._presets_view
+
+    def presets_snapshot(self) -> dict[str, PresetConfig]:
+        """Get a copy of all presets that later changes will not affect."""
         return self._presets.copy()
 
     def get_preset(self, preset_id: str) -> PresetConfig | None:
@@ -192,19 +337,21 @@ class PresetManager:
 
     def get_preset_by_name(self, name: str) -> PresetConfig | None:
         """Get a preset by name (case-insensitive)."""
-        name_lower = name.lower()
-        for preset in self._presets.values():
-            if preset.name.lower() == name_lower:
-                return preset
-        return None
+        preset_id = self._name_index.get(name.lower())
+        return self._presets.get(preset_id) if preset_id else None
 
     def find_preset(self, name_or_id: str) -> PresetConfig | None:
         """Find preset by ID or name."""
         return self.get_preset(name_or_id) or self.get_preset_by_name(name_or_id)
 
     def get_status(self, preset_id: str) -> PresetStatus:
-        """Get the status of a preset."""
-        return self._status.get(preset_id, PresetStatus())
+        """Get the status of a preset (read-only; use set_status to change it).
+
+        Presets not activated since setup get a new idle status, so callers
+        never share one instance.
+        """
+        status = self._status.get(preset_id)
+        return status if status is not None else PresetStatus()
 
     async def set_status(
         self,
@@ -213,18 +360,22 @@ class PresetManager:
         result: dict[str, Any] | None = None,
     ) -> None:
         """Update the status of a preset."""
-        if preset_id not in self._status:
-            self._status[preset_id] = PresetStatus()
+        preset_status = self._status.get(preset_id)
+        if preset_status is None:
+            preset_status = self._status[preset_id] = PresetStatus()
 
-        self._status[preset_id].status = status
+        preset_status.status = status
         if result is not None:
-            self._status[preset_id].last_result = result
+            preset_status.last_result = result
 
-        if status in [PRESET_STATUS_SUCCESS, PRESET_STATUS_FAILED]:
-            self._status[preset_id].last_activated = datetime.now(tz=UTC).isoformat()
+        if status in (PRESET_STATUS_SUCCESS, PRESET_STATUS_FAILED):
+            # Second precision is all the entity attribute needs
+            preset_status.last_activated = datetime.now(tz=UTC).isoformat(
+                timespec="seconds"
+            )
 
-        # Trigger entity updates
-        await self._notify_listeners()
+        # Trigger updates for this preset's entities only
+        self._notify_preset_listeners(preset_id)
 
     async def create_preset(
         self,
@@ -257,7 +408,7 @@ class PresetManager:
         )
 
         self._presets[preset_id] = preset
-        self._status[preset_id] = PresetStatus()
+        self._name_index.setdefault(name.lower(), preset_id)
 
         await self._save_presets()
 
@@ -266,12 +417,26 @@ class PresetManager:
 
     async def delete_preset(self, preset_id: str) -> bool:
         """Delete a preset and its associated entities."""
-        if preset_id not in self._presets:
-            _LOGGER.warning("Preset not found: %s", preset_id)
-            return False
+        return await self.delete_presets([preset_id]) == 1
+
+    async def delete_presets(self, preset_ids: Iterable[str]) -> int:
+        """Delete presets and their entities with a single save.
+
+        Returns the number of presets deleted.
+        """
+        removed: dict[str, PresetConfig] = {}
+        for preset_id in preset_ids:
+            preset = self._presets.pop(preset_id, None)
+            if preset is None:
+                _LOGGER.warning("Preset not found: %s", preset_id)
+                continue
+
+            self._status.pop(preset_id, None)
+            self._unindex_name(preset_id, preset.name)
+            removed[preset_id] = preset
 
-        preset = self._presets.pop(preset_id)
-        self._status.pop(preset_id, None)
+        if not removed:
+            return 0
 
         await self._save_presets()
 
@@ -279,24 +444,40 @@ class PresetManager:
         # _save_presets → async_update_entry) unsubscribes entity listeners before
         # _notify_listeners fires, so entity self-removal via _handle_preset_update
         # cannot run. Manual registry cleanup is required here.
-        try:
-            ent_reg = er.async_get(self.hass)
-            entry_id = self.entry.entry_id
-
-            for suffix in ("_button", "_status"):
-                unique_id = f"{entry_id}_preset_{preset_id}{suffix}"
-                domain = "button" if suffix == "_button" else "sensor"
-                entity_id = ent_reg.async_get_entity_id(
-                    domain, "ha_light_controller", unique_id
+        ent_reg: er.EntityRegistry | None = None
+        entry_id = self.entry.entry_id
+
+        for preset_id, preset in removed.items():
+            try:
+                if ent_reg is None:
+                    ent_reg = er.async_get(self.hass)
+                for domain, suffix in _PRESET_ENTITY_PLATFORMS:
+                    unique_id = f"{entry_id}_preset_{preset_id}{suffix}"
+                    entity_id = ent_reg.async_get_entity_id(domain, DOMAIN, unique_id)
+                    if entity_id:
+                        ent_reg.async_remove(entity_id)
+                        _LOGGER.debug("Removed %s entity: %s", domain, entity_id)
+            except Exception as e:
+                _LOGGER.warning(
+                    "Error removing entities for preset %s: %s", preset_id, e
                 )
-                if entity_id:
-                    ent_reg.async_remove(entity_id)
-                    _LOGGER.debug("Removed %s entity: %s", domain, entity_id)
-        except Exception as e:
-            _LOGGER.warning("Error removing entities for preset %s: %s", preset_id, e)
 
-        _LOGGER.info("Deleted preset: %s (%s)", preset.name, preset_id)
-        return True
+            _LOGGER.info("Deleted preset: %s (%s)", preset.name, preset_id)
+
+        return len(removed)
+
+    def _unindex_name(self, preset_id: str, name: str) -> None:
+        """Drop a removed preset from the name index."""
+        name_lower = name.lower()
+        if self._name_index.get(name_lower) != preset_id:
+            return
+
+        del self._name_index[name_lower]
+        # Fall back to the next preset sharing the name, if any
+        for other_id, other in self._presets.items():
+            if other.name.lower() == name_lower:
+                self._name_index[name_lower] = other_id
+                return
 
     async def create_preset_from_current(
         self, name: str, entities: list[str]
@@ -307,6 +488,7 @@ class PresetManager:
             return None
 
         targets: list[dict[str, Any]] = []
+        any_on = False
 
         for entity_id in entities:
             state = self.hass.states.get(entity_id)
@@ -314,6 +496,7 @@ class PresetManager:
                 continue
 
             is_on = state.state == "on"
+            any_on = any_on or is_on
             target: dict[str, Any] = {
                 "entity_id": entity_id,
                 "state": "on" if is_on else "off",
@@ -338,15 +521,12 @@ class PresetManager:
                     target["color_temp_kelvin"] = attrs["color_temperature_kelvin"]
 
                 # Effect
-                if "effect" in attrs and attrs["effect"] not in [None, "none", "None"]:
-                    target["effect"] = attrs["effect"]
+                effect = attrs.get("effect")
+                if effect not in _NO_EFFECTS:
+                    target["effect"] = effect
 
             targets.append(target)
 
-        # Determine overall state
-        states = [self.hass.states.get(e) for e in entities]
-        any_on = any(s and s.state == "on" for s in states)
-
         # Create preset
         preset = await self.create_preset(
             name=name,
@@ -363,6 +543,40 @@ class PresetManager:
 
         return preset
 
+    def _get_option_configs(
+        self, options: Mapping[str, Any]
+    ) -> tuple[ColorTolerance, RetryConfig, bool]:
+        """Get tolerance/retry/logging settings, rebuilt when options change."""
+        cached = self._option_configs
+        if cached is not None and cached[0] is options:
+            return cached[1], cached[2], cached[3]
+
+        tolerances = ColorTolerance(
+            brightness=options.get(
+                CONF_BRIGHTNESS_TOLERANCE, DEFAULT_BRIGHTNESS_TOLERANCE
+            ),
+            rgb=options.get(CONF_RGB_TOLERANCE, DEFAULT_RGB_TOLERANCE),
+            kelvin=options.get(CONF_KELVIN_TOLERANCE, DEFAULT_KELVIN_TOLERANCE),
+        )
+        retry_config = RetryConfig(
+            max_retries=int(options.get(CONF_MAX_RETRIES, DEFAULT_MAX_RETRIES)),
+            delay_after_send=float(
+                options.get(CONF_DELAY_AFTER_SEND, DEFAULT_DELAY_AFTER_SEND)
+            ),
+            max_runtime_seconds=float(
+                options.get(CONF_MAX_RUNTIME_SECONDS, DEFAULT_MAX_RUNTIME_SECONDS)
+            ),
+            use_exponential_backoff=options.get(
+                CONF_USE_EXPONENTIAL_BACKOFF, DEFAULT_USE_EXPONENTIAL_BACKOFF
+            ),
+            max_backoff_seconds=float(
+                options.get(CONF_MAX_BACKOFF_SECONDS, DEFAULT_MAX_BACKOFF_SECONDS)
+            ),
+        )
+        log_success = options.get(CONF_LOG_SUCCESS, DEFAULT_LOG_SUCCESS)
+        self._option_configs = (options, tolerances, retry_config, log_success)
+        return tolerances, retry_config, log_success
+
     async def activate_preset_with_options(
         self,
         preset: PresetConfig,
@@ -379,6 +593,7 @@ class PresetManager:
         Returns:
             Result dict from controller.ensure_state()
         """
+        tolerances, retry_config, log_success = self._get_option_configs(options)
         return await controller.ensure_state(
             entities=preset.entities,
             state_target=preset.state,
@@ -389,25 +604,7 @@ class PresetManager:
             targets=preset.targets if preset.targets else None,
             transition=preset.transition,
             skip_verification=preset.skip_verification,
-            brightness_tolerance=options.get(
-                CONF_BRIGHTNESS_TOLERANCE, DEFAULT_BRIGHTNESS_TOLERANCE
-            ),
-            rgb_tolerance=options.get(CONF_RGB_TOLERANCE, DEFAULT_RGB_TOLERANCE),
-            kelvin_tolerance=options.get(
-                CONF_KELVIN_TOLERANCE, DEFAULT_KELVIN_TOLERANCE
-            ),
-            delay_after_send=options.get(
-                CONF_DELAY_AFTER_SEND, DEFAULT_DELAY_AFTER_SEND
-            ),
-            max_retries=options.get(CONF_MAX_RETRIES, DEFAULT_MAX_RETRIES),
-            max_runtime_seconds=options.get(
-                CONF_MAX_RUNTIME_SECONDS, DEFAULT_MAX_RUNTIME_SECONDS
-            ),
-            use_exponential_backoff=options.get(
-                CONF_USE_EXPONENTIAL_BACKOFF, DEFAULT_USE_EXPONENTIAL_BACKOFF
-            ),
-            max_backoff_seconds=options.get(
-                CONF_MAX_BACKOFF_SECONDS, DEFAULT_MAX_BACKOFF_SECONDS
-            ),
-            log_success=options.get(CONF_LOG_SUCCESS, DEFAULT_LOG_SUCCESS),
+            tolerances=tolerances,
+            retry_config=retry_config,
+            log_success=log_success,
         )
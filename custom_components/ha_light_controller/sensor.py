@@ -20,7 +20,7 @@ from .const import (
     PRESET_STATUS_IDLE,
     PRESET_STATUS_SUCCESS,
 )
-from .preset_manager import PresetConfig, PresetManager
+from .preset_manager import PresetConfig, PresetManager, PresetStatus
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,23 +42,26 @@ async def async_setup_entry(
     @callback
     def async_add_preset_sensors() -> None:
         """Add sensor entities for new presets."""
+        presets = preset_manager.presets
+
         # Clean up tracking for deleted presets
-        added_preset_ids.intersection_update(preset_manager.presets.keys())
+        added_preset_ids.intersection_update(presets.keys())
+        if len(added_preset_ids) == len(presets):
+            return
 
         new_entities: list[PresetStatusSensor] = []
 
-        for preset_id, preset in preset_manager.presets.items():
-            if preset_id not in added_preset_ids:
-                entity = PresetStatusSensor(
-                    hass=hass,
-                    entry=entry,
-                    preset_manager=preset_manager,
-                    preset_id=preset_id,
-                    preset=preset,
-                )
-                new_entities.append(entity)
-                added_preset_ids.add(preset_id)
-                _LOGGER.debug("Adding status sensor for preset: %s", preset.name)
+        for preset_id in presets.keys() - added_preset_ids:
+            preset = presets[preset_id]
+            entity = PresetStatusSensor(
+                entry=entry,
+                preset_manager=preset_manager,
+                preset_id=preset_id,
+                preset=preset,
+            )
+            new_entities.append(entity)
+            added_preset_ids.add(preset_id)
+            _LOGGER.debug("Adding status sensor for preset: %s", preset.name)
 
         if new_entities:
             async_add_entities(new_entities)
@@ -86,14 +89,12 @@ class PresetStatusSensor(SensorEntity):
 
     def __init__(
         self,
-        hass: HomeAssistant,
         entry: LightControllerConfigEntry,
         preset_manager: PresetManager,
         preset_id: str,
         preset: PresetConfig,
     ) -> None:
         """Initialize the preset status sensor."""
-        self.hass = hass
         self._entry = entry
         self._preset_manager = preset_manager
         self._preset_id = preset_id
@@ -102,38 +103,30 @@ class PresetStatusSensor(SensorEntity):
         # Entity attributes
         self._attr_unique_id = f"{entry.entry_id}_preset_{preset_id}_status"
         self._attr_translation_placeholders = {"name": preset.name}
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for the preset."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
             name="Light Controller",
             manufacturer="Light Controller",
             model="Preset Manager",
         )
-
-    @property
-    def native_value(self) -> str:
-        """Return the current status."""
-        status = self._preset_manager.get_status(self._preset_id)
-        return status.status
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        preset = self._preset_manager.get_preset(self._preset_id)
-        status = self._preset_manager.get_status(self._preset_id)
-
+        status = preset_manager.get_status(preset_id)
+        self._attr_native_value = status.status
+        self._attr_extra_state_attributes = self._build_attributes(preset, status)
+        self._attr_available = True
+        self._removing = False
+        self._last_written: tuple[Any, ...] | None = None
+
+    def _build_attributes(
+        self, preset: PresetConfig, status: PresetStatus
+    ) -> dict[str, Any]:
+        """Build the extra state attributes for the preset and its status."""
         attrs: dict[str, Any] = {
             "preset_id": self._preset_id,
+            "preset_name": preset.name,
+            "target_state": preset.state,
+            "entity_count": len(preset.entities),
         }
 
-        if preset:
-            attrs["preset_name"] = preset.name
-            attrs["target_state"] = preset.state
-            attrs["entity_count"] = len(preset.entities)
-
         if status.last_activated:
             attrs["last_activated"] = status.last_activated
 
@@ -159,21 +152,34 @@ class PresetStatusSensor(SensorEntity):
 
         return attrs
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self._preset_manager.get_preset(self._preset_id) is not None
-
     @callback
     def _handle_preset_update(self) -> None:
         """Handle preset or status updates."""
         preset = self._preset_manager.get_preset(self._preset_id)
         if preset:
+            # Skip the state write when nothing the state is built from changed
+            status = self._preset_manager.get_status(self._preset_id)
+            written = (
+                preset,
+                status.status,
+                status.last_activated,
+                status.last_result,
+            )
+            if written == self._last_written:
+                return
+            self._last_written = written
+
             self._preset = preset
             self._attr_translation_placeholders = {"name": preset.name}
+            self._attr_native_value = status.status
+            self._attr_extra_state_attributes = self._build_attributes(preset, status)
             self.async_write_ha_state()
-        elif self.hass:
-            self.hass.async_create_task(self.async_remove())
+        else:
+            self._attr_available = False
+            # Several notifications can arrive before the removal runs
+            if self.hass and not self._removing:
+                self._removing = True
+                self.hass.async_create_task(self.async_remove())
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
@@ -181,7 +187,9 @@ class PresetStatusSensor(SensorEntity):
 
         # Register for updates
         self.async_on_remove(
-            self._preset_manager.register_listener(self._handle_preset_update)
+            self._preset_manager.register_preset_listener(
+                self._preset_id, self._handle_preset_update
+            )
         )
 
     async def async_will_remove_from_hass(self) -> None:
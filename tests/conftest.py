@@ -68,6 +68,9 @@ class MockOptionsFlow:
     def async_show_menu(self, **kwargs):
         return {"type": "menu", **kwargs}
 
+    def add_suggested_values_to_schema(self, data_schema, suggested_values):
+        return data_schema
+
 
 mock_ha.config_entries.ConfigFlow = MockConfigFlow
 mock_ha.config_entries.OptionsFlow = MockOptionsFlow
@@ -150,6 +153,26 @@ class MockButtonEntity:
     _attr_name = None
     _attr_icon = None
 
+    hass = None
+    _attr_device_info = None
+    _attr_extra_state_attributes = None
+    _attr_available = True
+
+    @property
+    def available(self):
+        return self._attr_available
+
+    @property
+    def device_info(self):
+        return self._attr_device_info
+
+    @property
+    def extra_state_attributes(self):
+        return self._attr_extra_state_attributes
+
+    def async_write_ha_state(self):
+        pass
+
     async def async_added_to_hass(self):
         pass
 
@@ -165,6 +188,32 @@ class MockSensorEntity:
     _attr_name = None
     _attr_icon = None
 
+    _attr_native_value = None
+
+    @property
+    def native_value(self):
+        return self._attr_native_value
+
+    hass = None
+    _attr_device_info = None
+    _attr_extra_state_attributes = None
+    _attr_available = True
+
+    @property
+    def available(self):
+        return self._attr_available
+
+    @property
+    def device_info(self):
+        return self._attr_device_info
+
+    @property
+    def extra_state_attributes(self):
+        return self._attr_extra_state_attributes
+
+    def async_write_ha_state(self):
+        pass
+
     async def async_added_to_hass(self):
         pass
 
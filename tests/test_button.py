@@ -63,6 +63,7 @@ def mock_preset_manager(mock_preset):
     manager.get_status = MagicMock(return_value=PresetStatus())
     manager.set_status = AsyncMock()
     manager.register_listener = MagicMock(return_value=MagicMock())
+    manager.register_preset_listener = MagicMock(return_value=MagicMock())
     manager.activate_preset_with_options = AsyncMock(
         return_value={"success": True, "result": "success"}
     )
@@ -85,7 +86,6 @@ def button_entity(
 ):
     """Create a PresetButton entity."""
     return PresetButton(
-        hass=hass,
         entry=config_entry,
         preset_manager=mock_preset_manager,
         controller=mock_controller,
@@ -181,6 +181,10 @@ class TestPresetButton:
     def test_unavailable_when_preset_deleted(self, button_entity, mock_preset_manager):
         """Test availability when preset is deleted."""
         mock_preset_manager.get_preset.return_value = None
+        button_entity.async_remove = MagicMock()
+
+        button_entity._handle_preset_update()
+
         assert button_entity.available is False
 
 
@@ -214,7 +218,6 @@ class TestPresetButtonAttributes:
         mock_preset_manager.get_preset.return_value = preset
 
         button = PresetButton(
-            hass=hass,
             entry=config_entry,
             preset_manager=mock_preset_manager,
             controller=mock_controller,
@@ -240,7 +243,6 @@ class TestPresetButtonAttributes:
         mock_preset_manager.get_preset.return_value = preset
 
         button = PresetButton(
-            hass=hass,
             entry=config_entry,
             preset_manager=mock_preset_manager,
             controller=mock_controller,
@@ -268,7 +270,6 @@ class TestPresetButtonAttributes:
         mock_preset_manager.get_preset.return_value = preset
 
         button = PresetButton(
-            hass=hass,
             entry=config_entry,
             preset_manager=mock_preset_manager,
             controller=mock_controller,
@@ -288,18 +289,39 @@ class TestPresetButtonAttributes:
             last_result={"result": "success", "message": "Done"},
             last_activated="2024-01-15T10:30:00",
         )
+        button_entity._handle_preset_update()
 
         attrs = button_entity.extra_state_attributes
         assert attrs["last_result"] == "success"
         assert attrs["last_activated"] == "2024-01-15T10:30:00"
 
-    def test_extra_state_attributes_empty_when_preset_deleted(
+    def test_preset_attributes_reused_for_status_changes(
         self, button_entity, mock_preset_manager
     ):
-        """Test extra state attributes are empty when preset is deleted."""
-        mock_preset_manager.get_preset.return_value = None
+        """Test status updates reuse the attributes built from the preset."""
+        preset_attrs = button_entity._preset_attrs
+        mock_preset_manager.get_status.return_value = PresetStatus(
+            status=PRESET_STATUS_SUCCESS,
+            last_activated="2024-01-15T10:30:00",
+        )
+
+        button_entity._handle_preset_update()
+
+        assert button_entity._preset_attrs is preset_attrs
+        assert "last_activated" not in preset_attrs
+        assert button_entity.extra_state_attributes["brightness_pct"] == 75
+
+    def test_extra_state_attributes_kept_when_preset_deleted(
+        self, button_entity, mock_preset_manager
+    ):
+        """Test attributes are left alone while a deleted preset's button is removed."""
         attrs = button_entity.extra_state_attributes
-        assert attrs == {}
+        mock_preset_manager.get_preset.return_value = None
+        button_entity.async_remove = MagicMock()
+
+        button_entity._handle_preset_update()
+
+        assert button_entity.extra_state_attributes is attrs
 
 
 class TestPresetButtonPress:
@@ -411,7 +433,6 @@ class TestPresetButtonPress:
         }
 
         button = PresetButton(
-            hass=hass,
             entry=config_entry,
             preset_manager=mock_preset_manager,
             controller=mock_controller,
@@ -436,7 +457,7 @@ class TestPresetButtonLifecycle:
 
         await button_entity.async_added_to_hass()
 
-        mock_preset_manager.register_listener.assert_called()
+        mock_preset_manager.register_preset_listener.assert_called_once()
         button_entity.async_on_remove.assert_called()
 
     @pytest.mark.asyncio
@@ -463,10 +484,27 @@ class TestPresetButtonLifecycle:
         assert button_entity._attr_translation_placeholders == {"name": "Updated Name"}
         button_entity.async_write_ha_state.assert_called_once()
 
+    def test_handle_preset_update_skips_unchanged(
+        self, button_entity, mock_preset_manager
+    ):
+        """Test repeated updates without changes write state once."""
+        button_entity.async_write_ha_state = MagicMock()
+
+        button_entity._handle_preset_update()
+        button_entity._handle_preset_update()
+        button_entity.async_write_ha_state.assert_called_once()
+
+        mock_preset_manager.get_status.return_value = PresetStatus(
+            status=PRESET_STATUS_SUCCESS
+        )
+        button_entity._handle_preset_update()
+        assert button_entity.async_write_ha_state.call_count == 2
+
     def test_handle_preset_update_deleted(
         self, button_entity, mock_preset_manager, hass
     ):
         """Test handling when preset is deleted schedules self-removal."""
+        button_entity.hass = hass
         button_entity.async_write_ha_state = MagicMock()
         button_entity.async_remove = AsyncMock()
         mock_preset_manager.get_preset.return_value = None
@@ -477,3 +515,16 @@ class TestPresetButtonLifecycle:
         button_entity.async_write_ha_state.assert_not_called()
         # Should schedule self-removal via async_create_task
         hass.async_create_task.assert_called_once()
+
+    def test_handle_preset_update_deleted_removes_once(
+        self, button_entity, mock_preset_manager, hass
+    ):
+        """Test repeated updates for a deleted preset schedule one removal."""
+        button_entity.hass = hass
+        button_entity.async_remove = MagicMock()
+        mock_preset_manager.get_preset.return_value = None
+
+        button_entity._handle_preset_update()
+        button_entity._handle_preset_update()
+
+        hass.async_create_task.assert_called_once()
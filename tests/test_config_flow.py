@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -25,6 +26,7 @@ from custom_components.ha_light_controller.const import (
     CONF_MAX_BACKOFF_SECONDS,
     CONF_MAX_RETRIES,
     CONF_MAX_RUNTIME_SECONDS,
+    CONF_PRESETS,
     CONF_RGB_TOLERANCE,
     CONF_USE_EXPONENTIAL_BACKOFF,
     DEFAULT_BRIGHTNESS_PCT,
@@ -39,6 +41,7 @@ from custom_components.ha_light_controller.const import (
     PRESET_STATE,
     PRESET_TRANSITION,
 )
+from custom_components.ha_light_controller.preset_manager import PresetManager
 
 # =============================================================================
 # ConfigFlow Tests
@@ -101,6 +104,24 @@ class TestLightControllerConfigFlow:
         assert result["options"][CONF_DEFAULT_BRIGHTNESS_PCT] == DEFAULT_BRIGHTNESS_PCT
         assert result["options"][CONF_DEFAULT_TRANSITION] == DEFAULT_TRANSITION
 
+    @pytest.mark.asyncio
+    async def test_step_user_ignores_unknown_keys(self, hass):
+        """Test that only known option keys are stored on the entry."""
+        flow = LightControllerConfigFlow()
+        flow.hass = hass
+        flow.context = {}
+
+        flow.async_set_unique_id = AsyncMock()
+        flow._abort_if_unique_id_configured = MagicMock()
+
+        result = await flow.async_step_user(
+            user_input={CONF_MAX_RETRIES: 5, "unexpected": True}
+        )
+
+        assert result["options"][CONF_MAX_RETRIES] == 5
+        assert "unexpected" not in result["options"]
+        assert len(result["options"]) == 11
+
     def test_async_get_options_flow(self):
         """Test that options flow handler is returned."""
         entry = MagicMock(spec=ConfigEntry)
@@ -145,6 +166,27 @@ class TestLightControllerOptionsFlow:
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "settings"
 
+    @pytest.mark.asyncio
+    async def test_step_settings_suggests_current_options(self, options_flow, hass):
+        """Test settings form injects current options into every section."""
+        options_flow.hass = hass
+        options_flow.add_suggested_values_to_schema = MagicMock(
+            side_effect=lambda schema, _: schema
+        )
+
+        await options_flow.async_step_settings()
+
+        suggested = options_flow.add_suggested_values_to_schema.call_args[0][1]
+        assert set(suggested) == {
+            "defaults",
+            "tolerances",
+            "retry_settings",
+            "notifications",
+        }
+        assert all(
+            values is options_flow.config_entry.options for values in suggested.values()
+        )
+
     @pytest.mark.asyncio
     async def test_step_settings_saves(self, options_flow, hass):
         """Test settings step saves all options."""
@@ -532,6 +574,9 @@ class TestOptionsFlowAddPreset:
         assert call_kwargs["name"] == "Test Preset"
         assert len(call_kwargs["targets"]) == 2
         assert call_kwargs["skip_verification"] is True
+        assert flow._preset_data == {}
+        assert flow._configuring_entity is None
+        assert flow._editing_preset_id is None
 
 
 class TestOptionsFlowManagePresets:
@@ -618,6 +663,98 @@ class TestOptionsFlowManagePresets:
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "delete_preset"
 
+    @pytest.mark.asyncio
+    async def test_step_delete_preset_reuses_options_until_version_changes(
+        self, options_flow_with_presets
+    ):
+        """Test preset options are cached per preset manager version."""
+        flow, preset_manager = options_flow_with_presets
+        presets = preset_manager.presets
+
+        first = flow._get_preset_options("delete_preset", 1, presets, str)
+        second = flow._get_preset_options("delete_preset", 1, presets, str)
+        third = flow._get_preset_options("delete_preset", 2, presets, str)
+
+        assert first is second
+        assert third is not first
+        assert len(third) == 2
+
+    @pytest.mark.asyncio
+    async def test_step_delete_preset_rebuilds_options_after_reload(
+        self, hass, config_entry_with_presets
+    ):
+        """Test options are rebuilt when a reload replaces the preset manager."""
+        all_presets = config_entry_with_presets.data[CONF_PRESETS]
+        old_entry = MagicMock()
+        old_entry.entry_id = config_entry_with_presets.entry_id
+        old_entry.data = {CONF_PRESETS: {"preset_1": all_presets["preset_1"]}}
+
+        flow = LightControllerOptionsFlow()
+        flow._config_entry = config_entry_with_presets
+        flow.hass = hass
+        runtime_data = MagicMock()
+        runtime_data.preset_manager = PresetManager(hass, old_entry)
+        config_entry_with_presets.runtime_data = runtime_data
+
+        await flow.async_step_delete_preset()
+        runtime_data.preset_manager = PresetManager(hass, config_entry_with_presets)
+        await flow.async_step_delete_preset()
+
+        _, options, entries = flow._preset_options["delete_preset"]
+        assert list(entries) == ["preset_1", "preset_2"]
+        assert len(options) == 2
+
+    @pytest.mark.asyncio
+    async def test_step_edit_preset_rebuilds_entries_after_reload(
+        self, hass, config_entry_with_presets
+    ):
+        """Test per-preset options are not reused from a replaced preset manager."""
+        flow = LightControllerOptionsFlow()
+        flow._config_entry = config_entry_with_presets
+        flow.hass = hass
+        runtime_data = MagicMock()
+        runtime_data.preset_manager = PresetManager(hass, config_entry_with_presets)
+        config_entry_with_presets.runtime_data = runtime_data
+
+        await flow.async_step_edit_preset()
+        renamed = dict(config_entry_with_presets.data[CONF_PRESETS])
+        renamed["preset_1"] = {**renamed["preset_1"], "name": "Renamed"}
+        reloaded_entry = MagicMock()
+        reloaded_entry.entry_id = config_entry_with_presets.entry_id
+        reloaded_entry.data = {CONF_PRESETS: renamed}
+        reloaded = PresetManager(hass, reloaded_entry)
+        runtime_data.preset_manager = reloaded
+        await flow.async_step_edit_preset()
+
+        _, _, entries = flow._preset_options["edit_preset"]
+        assert entries["preset_1"][0].name == "Renamed"
+        assert all(
+            preset is reloaded.presets[pid] for pid, (preset, _) in entries.items()
+        )
+
+    @pytest.mark.asyncio
+    async def test_preset_options_relabel_only_changed_presets(
+        self, options_flow_with_presets
+    ):
+        """Test a version change only builds options for new or replaced presets."""
+        flow, preset_manager = options_flow_with_presets
+        presets = dict(preset_manager.presets)
+        labelled: list[str] = []
+
+        def label(preset):
+            labelled.append(preset.id)
+            return preset.name
+
+        flow._get_preset_options("edit_preset", 1, presets, label)
+        assert len(labelled) == 2
+
+        labelled.clear()
+        replaced_id = next(iter(presets))
+        presets[replaced_id] = dataclasses.replace(presets[replaced_id])
+        flow._get_preset_options("edit_preset", 2, presets, label)
+
+        assert labelled == [replaced_id]
+
     @pytest.mark.asyncio
     async def test_step_delete_preset_goes_to_confirmation(
         self, options_flow_with_presets
@@ -724,6 +861,26 @@ class TestOptionsFlowEditPreset:
         assert flow._editing_preset_id == "preset_1"
         assert flow._preset_data["name"] == "Preset One"
 
+    @pytest.mark.asyncio
+    async def test_step_edit_preset_entity_changes_leave_preset_untouched(
+        self, options_flow_with_presets, hass
+    ):
+        """Test adding/removing entities while editing doesn't mutate the preset."""
+        flow, preset_manager = options_flow_with_presets
+        hass.states.get = MagicMock(return_value=None)
+        preset = preset_manager.presets["preset_1"]
+
+        await flow.async_step_edit_preset(user_input={"preset_to_edit": "preset_1"})
+        await flow.async_step_add_more_entities(
+            user_input={"new_entities": ["light.test_2"]}
+        )
+        await flow.async_step_remove_entity(
+            user_input={"entity_to_remove": "light.test_1"}
+        )
+
+        assert flow._preset_data[PRESET_ENTITIES] == ["light.test_2"]
+        assert preset.entities == ["light.test_1"]
+
     @pytest.mark.asyncio
     async def test_step_edit_preset_invalid_selection(self, options_flow_with_presets):
         """Test invalid preset selection returns to menu."""
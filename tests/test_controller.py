@@ -33,28 +33,28 @@ from custom_components.ha_light_controller.controller import (
 class TestTargetState:
     """Tests for TargetState enum."""
 
-    def test_from_string_on(self):
-        """Test parsing 'on' string."""
-        assert TargetState.from_string("on") == TargetState.ON
-        assert TargetState.from_string("ON") == TargetState.ON
-        assert TargetState.from_string("  on  ") == TargetState.ON
-
-    def test_from_string_off(self):
-        """Test parsing 'off' string."""
-        assert TargetState.from_string("off") == TargetState.OFF
-        assert TargetState.from_string("OFF") == TargetState.OFF
-        assert TargetState.from_string("  off  ") == TargetState.OFF
-
-    def test_from_string_invalid(self):
-        """Test parsing invalid string raises ValueError."""
+    def test_lookup_on(self):
+        """Test looking up 'on' string."""
+        assert TargetState("on") == TargetState.ON
+        assert TargetState("ON") == TargetState.ON
+        assert TargetState("  on  ") == TargetState.ON
+
+    def test_lookup_off(self):
+        """Test looking up 'off' string."""
+        assert TargetState("off") == TargetState.OFF
+        assert TargetState("OFF") == TargetState.OFF
+        assert TargetState("  off  ") == TargetState.OFF
+
+    def test_lookup_invalid(self):
+        """Test looking up invalid string raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
-            TargetState.from_string("invalid")
+            TargetState("invalid")
         assert "Invalid state" in str(exc_info.value)
 
-    def test_from_string_empty(self):
-        """Test parsing empty string raises ValueError."""
+    def test_lookup_empty(self):
+        """Test looking up empty string raises ValueError."""
         with pytest.raises(ValueError):
-            TargetState.from_string("")
+            TargetState("")
 
 
 # =============================================================================
@@ -125,6 +125,16 @@ class TestRetryConfig:
         # Attempt 5: would be 64.0, but capped at 10.0
         assert config.calculate_delay(5) == 10.0
 
+    def test_delay_schedule_matches_calculate_delay(self):
+        """Test the precomputed schedule has one delay per attempt."""
+        config = RetryConfig(
+            max_retries=5,
+            delay_after_send=2.0,
+            use_exponential_backoff=True,
+            max_backoff_seconds=10.0,
+        )
+        assert config.delay_schedule() == (2.0, 4.0, 8.0, 10.0, 10.0)
+
 
 # =============================================================================
 # LightTarget Tests
@@ -143,6 +153,30 @@ class TestLightTarget:
         assert target.color_temp_kelvin is None
         assert target.effect is None
 
+    def test_uses_slots(self):
+        """Test targets don't carry a per-instance __dict__."""
+        target = LightTarget(entity_id="light.test")
+        assert not hasattr(target, "__dict__")
+
+    def test_settings_key(self):
+        """Test the grouping key is built from the light settings."""
+        target = LightTarget(
+            entity_id="light.test", brightness_pct=40, rgb_color=[1, 2, 3]
+        )
+        assert target.settings_key == (40, (1, 2, 3), None, None)
+        assert (
+            LightTarget(
+                entity_id="light.other", brightness_pct=40, rgb_color=[1, 2, 3]
+            ).settings_key
+            == target.settings_key
+        )
+
+    def test_entity_id_is_interned(self):
+        """Test equal entity ids share a single string object."""
+        entity_id = "".join(["light.", "test"])
+        target = LightTarget(entity_id=entity_id)
+        assert target.entity_id is LightTarget(entity_id="light.test").entity_id
+
     def test_to_service_data_brightness_only(self):
         """Test service data with brightness only."""
         target = LightTarget(entity_id="light.test", brightness_pct=75)
@@ -157,7 +191,7 @@ class TestLightTarget:
             rgb_color=[255, 128, 64],
         )
         data = target.to_service_data()
-        assert data == {"brightness_pct": 80, "rgb_color": [255, 128, 64]}
+        assert data == {"brightness_pct": 80, "rgb_color": (255, 128, 64)}
 
     def test_to_service_data_with_kelvin(self):
         """Test service data with color temperature."""
@@ -242,9 +276,17 @@ class TestLightGroup:
             entities=["light.a", "light.b"],
             brightness_pct=75,
         )
-        assert group.entities == ["light.a", "light.b"]
+        assert group.entities == ("light.a", "light.b")
         assert group.brightness_pct == 75
 
+    def test_is_frozen(self):
+        """Test groups are immutable once built."""
+        import dataclasses
+
+        group = LightGroup(entities=["light.a"], brightness_pct=75)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            group.entities = ("light.b",)
+
     def test_to_service_data(self):
         """Test service data conversion."""
         group = LightGroup(
@@ -269,6 +311,13 @@ class TestLightGroup:
             "transition": 1.5,
         }
 
+    def test_to_service_data_returns_independent_copies(self):
+        """Test callers can mutate service data without touching the group."""
+        group = LightGroup(entities=["light.a"], brightness_pct=60)
+        first = group.to_service_data()
+        first["entity_id"] = group.entities
+        assert group.to_service_data() == {"brightness_pct": 60}
+
 
 # =============================================================================
 # OperationResult Tests
@@ -291,6 +340,13 @@ class TestOperationResult:
         assert result.success is True
         assert result.result_code == RESULT_CODE_SUCCESS
 
+    def test_uses_slots(self):
+        """Test results don't carry a per-instance __dict__."""
+        result = OperationResult(
+            success=True, result_code=RESULT_CODE_SUCCESS, message="ok"
+        )
+        assert not hasattr(result, "__dict__")
+
     def test_to_dict(self):
         """Test conversion to dictionary."""
         result = OperationResult(
@@ -313,6 +369,14 @@ class TestOperationResult:
         assert data["skipped_lights"] == ["light.c"]
         assert data["elapsed_seconds"] == 10.12  # Rounded to 2 decimal places
 
+    def test_to_dict_defaults_to_empty_light_lists(self):
+        """Test unset failed/skipped lights serialize as empty lists."""
+        data = OperationResult(
+            success=True, result_code=RESULT_CODE_SUCCESS, message="ok"
+        ).to_dict()
+        assert data["failed_lights"] == []
+        assert data["skipped_lights"] == []
+
 
 # =============================================================================
 # ColorTolerance Tests
@@ -423,6 +487,23 @@ class TestLightControllerEntityExpansion:
         # Should only have unique entries
         assert valid.count("light.test_light_1") == 1
 
+    def test_expand_entities_expands_repeated_inputs_once(
+        self, hass, mock_light_states
+    ):
+        """Test that a repeated input entity is only expanded once."""
+        from unittest.mock import patch
+
+        controller = LightController(hass)
+        with patch.object(
+            controller, "_expand_entity", wraps=controller._expand_entity
+        ) as expand:
+            valid, _ = controller._expand_entities(
+                ["light.test_group", "light.test_group", "light.test_light_1"]
+            )
+
+        assert expand.call_count == 2
+        assert valid.count("light.test_light_1") == 1
+
     def test_expand_invalid_entity_type(self, hass, mock_light_states):
         """Test expanding non-light entity."""
         controller = LightController(hass)
@@ -470,7 +551,7 @@ class TestLightControllerTargetBuilding:
         )
         # First light has override
         assert targets[0].brightness_pct == 50
-        assert targets[0].rgb_color == [255, 0, 0]
+        assert targets[0].rgb_color == (255, 0, 0)
         # Second light uses defaults
         assert targets[1].brightness_pct == 100
         assert targets[1].rgb_color is None
@@ -1183,6 +1264,9 @@ class TestLightControllerVerificationEdgeCases:
         # Both specified and both wrong = WRONG_COLOR
         assert result == VerificationResult.WRONG_COLOR
 
+        # One state lookup serves the state, brightness and both color checks
+        assert hass.states.get.call_count == 1
+
     def test_verify_light_both_rgb_and_kelvin_rgb_matches(self, hass):
         """Test verifying light with both RGB and kelvin when RGB matches."""
         from tests.conftest import create_light_state
@@ -1372,6 +1456,28 @@ class TestLightControllerEnsureStateAdvanced:
         assert result["success"] is False
         assert result["result"] == RESULT_CODE_FAILED
 
+    @pytest.mark.asyncio
+    async def test_ensure_state_accepts_float_max_retries(
+        self, hass, mock_light_states
+    ):
+        """Test a float max_retries from the options slider is used as a count."""
+        from tests.conftest import create_light_state
+
+        wrong_state = create_light_state("light.test_light_1", STATE_OFF)
+        hass.states.get = MagicMock(return_value=wrong_state)
+
+        controller = LightController(hass)
+        result = await controller.ensure_state(
+            entities=["light.test_light_1"],
+            state_target="on",
+            max_retries=3.0,
+            max_runtime_seconds=60,
+            delay_after_send=0.001,
+        )
+
+        assert result["result"] == RESULT_CODE_FAILED
+        assert result["attempts"] == 3
+
     @pytest.mark.asyncio
     async def test_ensure_state_success_with_skipped_and_log(
         self, hass, mock_light_states
@@ -1563,6 +1669,21 @@ class TestMixedStateHandling:
         ]
         assert "light.off_1" in all_off_entities
 
+    @pytest.mark.asyncio
+    async def test_send_commands_returns_dispatch_batches(
+        self, hass, mock_light_states
+    ):
+        """Test that each service call's targets are returned as one batch."""
+        controller = LightController(hass)
+        on_1 = LightTarget("light.on_1", brightness_pct=100, state="on")
+        on_2 = LightTarget("light.on_2", brightness_pct=50, state="on")
+        off_1 = LightTarget("light.off_1", state="off")
+
+        batches = await controller._send_commands_per_target([on_1, off_1, on_2])
+
+        # OFF batch first, then one batch per turn_on group
+        assert batches == [[off_1], [on_1], [on_2]]
+
     @pytest.mark.asyncio
     async def test_send_commands_groups_on_targets_by_settings(
         self, hass, mock_light_states
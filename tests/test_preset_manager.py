@@ -58,6 +58,31 @@ class TestPresetConfig:
         assert preset.transition == 0.0
         assert preset.skip_verification is False
 
+    def test_display_label(self):
+        """Test display label pluralizes the entity count."""
+        single = PresetConfig(id="a", name="Reading", entities=["light.a"])
+        multiple = PresetConfig(id="b", name="Movie", entities=["light.a", "light.b"])
+        assert single.display_label == "Reading (1 entity)"
+        assert multiple.display_label == "Movie (2 entities)"
+
+    def test_display_label_rebuilt_after_change(self):
+        """Test the cached label follows field changes and in-place edits."""
+        preset = PresetConfig(id="a", name="Reading", entities=["light.a"])
+        assert preset.display_label == "Reading (1 entity)"
+
+        preset.name = "Study"
+        assert preset.display_label == "Study (1 entity)"
+
+        preset.entities.append("light.b")
+        preset._invalidate()
+        assert preset.display_label == "Study (2 entities)"
+
+    def test_uses_slots(self):
+        """Test presets don't carry a per-instance __dict__."""
+        preset = PresetConfig(id="a", name="Reading", entities=["light.a"])
+        assert not hasattr(preset, "__dict__")
+        assert not hasattr(PresetStatus(), "__dict__")
+
     def test_from_dict_minimal(self):
         """Test creating from minimal dictionary."""
         data = {
@@ -107,6 +132,31 @@ class TestPresetConfig:
         assert preset.id is not None
         assert len(preset.id) == 36  # UUID format
 
+    def test_from_dict_copies_lists(self):
+        """Test that loaded presets don't share lists with the stored data."""
+        data = {
+            PRESET_ENTITIES: ["light.a"],
+            PRESET_TARGETS: [{"entity_id": "light.a", "brightness_pct": 25}],
+        }
+        preset = PresetConfig.from_dict(data)
+
+        assert preset.entities == data[PRESET_ENTITIES]
+        assert preset.entities is not data[PRESET_ENTITIES]
+        assert preset.targets == data[PRESET_TARGETS]
+        assert preset.targets[0] is not data[PRESET_TARGETS][0]
+
+    def test_from_dict_keeps_id_without_generating_uuid(self):
+        """Test that no UUID is generated when the ID is present."""
+        from unittest.mock import patch
+
+        with patch(
+            "custom_components.ha_light_controller.preset_manager.uuid.uuid4"
+        ) as mock_uuid4:
+            preset = PresetConfig.from_dict({PRESET_ID: "kept", PRESET_NAME: "Kept"})
+
+        assert preset.id == "kept"
+        mock_uuid4.assert_not_called()
+
     def test_to_dict(self):
         """Test converting to dictionary."""
         preset = PresetConfig(
@@ -135,6 +185,24 @@ class TestPresetConfig:
         assert data[PRESET_TRANSITION] == 1.0
         assert data[PRESET_SKIP_VERIFICATION] is True
 
+    def test_to_dict_is_cached(self):
+        """Test to_dict builds the storage dict only once."""
+        preset = PresetConfig(id="test_id", name="Test", entities=["light.a"])
+
+        assert preset.to_dict() is preset.to_dict()
+
+    def test_to_dict_rebuilt_after_field_change(self):
+        """Test changing a field invalidates the cached storage dict."""
+        preset = PresetConfig(id="test_id", name="Test", entities=["light.a"])
+        before = preset.to_dict()
+
+        preset.name = "Renamed"
+
+        after = preset.to_dict()
+        assert after is not before
+        assert after[PRESET_NAME] == "Renamed"
+        assert before[PRESET_NAME] == "Test"
+
 
 # =============================================================================
 # PresetStatus Tests
@@ -175,7 +243,7 @@ class TestPresetManagerInit:
         """Test initialization with no presets."""
         manager = PresetManager(hass, config_entry)
         assert len(manager.presets) == 0
-        assert manager._listeners == []
+        assert manager._listeners == {}
 
     def test_init_with_presets(self, hass, config_entry_with_presets):
         """Test initialization with existing presets."""
@@ -272,6 +340,26 @@ class TestPresetManagerCRUD:
         assert result is True
         assert "preset_1" not in manager.presets
 
+    @pytest.mark.asyncio
+    async def test_delete_preset_registry_lookup_error(
+        self, hass, config_entry_with_presets, monkeypatch
+    ):
+        """Test a failing registry lookup does not undo a saved deletion."""
+        from homeassistant.helpers import entity_registry as er
+
+        monkeypatch.setattr(
+            er, "async_get", MagicMock(side_effect=Exception("Registry unavailable"))
+        )
+
+        manager = PresetManager(hass, config_entry_with_presets)
+
+        result = await manager.delete_preset("preset_1")
+
+        assert result is True
+        assert "preset_1" not in manager.presets
+        saved = hass.config_entries.async_update_entry.call_args.kwargs["data"]
+        assert "preset_1" not in saved[CONF_PRESETS]
+
     @pytest.mark.asyncio
     async def test_delete_preset_entity_not_in_registry(
         self, hass, config_entry_with_presets
@@ -283,6 +371,25 @@ class TestPresetManagerCRUD:
         assert result is True
         assert "preset_1" not in manager.presets
 
+    @pytest.mark.asyncio
+    async def test_delete_presets_saves_once(self, hass, config_entry_with_presets):
+        """Test bulk deletion saves once and shares the registry handle."""
+        from homeassistant.helpers import entity_registry as er
+
+        mock_ent_reg = MagicMock()
+        mock_ent_reg.async_get_entity_id = MagicMock(return_value=None)
+        er.async_get = MagicMock(return_value=mock_ent_reg)
+
+        manager = PresetManager(hass, config_entry_with_presets)
+
+        deleted = await manager.delete_presets(["preset_1", "preset_2", "missing"])
+
+        assert deleted == 2
+        assert manager.presets == {}
+        hass.config_entries.async_update_entry.assert_called_once()
+        er.async_get.assert_called_once()
+        assert mock_ent_reg.async_get_entity_id.call_count == 4
+
     @pytest.mark.asyncio
     async def test_delete_preset_not_found(self, hass, config_entry):
         """Test deleting a non-existent preset."""
@@ -290,6 +397,58 @@ class TestPresetManagerCRUD:
         result = await manager.delete_preset("nonexistent")
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_version_changes_on_save(self, hass, config_entry):
+        """Test the version counter moves on create and delete."""
+
+        def update_entry(entry, data):
+            entry.data = data
+
+        hass.config_entries.async_update_entry.side_effect = update_entry
+        manager = PresetManager(hass, config_entry)
+        initial = manager.version
+
+        preset = await manager.create_preset(name="Versioned", entities=["light.a"])
+        created = manager.version
+        await manager.delete_preset(preset.id)
+
+        assert initial < created < manager.version
+
+    def test_version_unique_across_managers(self, hass, config_entry):
+        """Test a manager rebuilt on reload does not reuse an earlier version."""
+        first = PresetManager(hass, config_entry)
+        second = PresetManager(hass, config_entry)
+
+        assert second.version != first.version
+
+    @pytest.mark.asyncio
+    async def test_save_skips_unchanged_presets(self, hass, config_entry_with_presets):
+        """Test saving identical presets does not rewrite the entry."""
+        manager = PresetManager(hass, config_entry_with_presets)
+        listener = MagicMock()
+        manager.register_listener(listener)
+        initial = manager.version
+
+        await manager._save_presets()
+
+        hass.config_entries.async_update_entry.assert_not_called()
+        listener.assert_not_called()
+        assert manager.version == initial
+
+    @pytest.mark.asyncio
+    async def test_batch_saves_once(self, hass, config_entry_with_presets):
+        """Test changes inside a batch are saved once when it exits."""
+        manager = PresetManager(hass, config_entry_with_presets)
+        initial = manager.version
+
+        async with manager.batch():
+            await manager.delete_preset("preset_1")
+            await manager.create_preset(name="Replacement", entities=["light.a"])
+            hass.config_entries.async_update_entry.assert_not_called()
+
+        hass.config_entries.async_update_entry.assert_called_once()
+        assert manager.version > initial
+
 
 class TestPresetManagerLookup:
     """Tests for PresetManager lookup methods."""
@@ -327,15 +486,44 @@ class TestPresetManagerLookup:
         preset = manager.get_preset_by_name("Nonexistent Preset")
         assert preset is None
 
-    def test_presets_property_returns_copy(self, hass, config_entry_with_presets):
-        """Test that presets property returns a copy."""
+    @pytest.mark.asyncio
+    async def test_get_preset_by_name_tracks_create_and_delete(
+        self, hass, config_entry
+    ):
+        """Test name lookups follow created and deleted presets."""
+        manager = PresetManager(hass, config_entry)
+        first = await manager.create_preset(name="Evening", entities=["light.a"])
+        second = await manager.create_preset(name="evening", entities=["light.b"])
+
+        assert manager.get_preset_by_name("EVENING") is first
+
+        await manager.delete_preset(first.id)
+        assert manager.get_preset_by_name("Evening") is second
+
+        await manager.delete_preset(second.id)
+        assert manager.get_preset_by_name("Evening") is None
+
+    def test_presets_property_is_read_only(self, hass, config_entry_with_presets):
+        """Test that presets property returns a read-only view."""
         manager = PresetManager(hass, config_entry_with_presets)
-        presets_copy = manager.presets
+        presets = manager.presets
 
-        # Modifying the copy should not affect the original
-        presets_copy["new_key"] = "test"
+        with pytest.raises(TypeError):
+            presets["new_key"] = "test"
         assert "new_key" not in manager._presets
 
+    @pytest.mark.asyncio
+    async def test_presets_view_tracks_changes(self, hass, config_entry_with_presets):
+        """Test the presets view reflects later changes but snapshots do not."""
+        manager = PresetManager(hass, config_entry_with_presets)
+        presets = manager.presets
+        snapshot = manager.presets_snapshot()
+
+        await manager.delete_preset("preset_1")
+
+        assert "preset_1" not in presets
+        assert "preset_1" in snapshot
+
 
 class TestPresetManagerStatus:
     """Tests for PresetManager status tracking."""
@@ -346,12 +534,35 @@ class TestPresetManagerStatus:
         status = manager.get_status("preset_1")
         assert status.status == PRESET_STATUS_IDLE
 
+    @pytest.mark.asyncio
+    async def test_status_allocated_on_first_set(self, hass, config_entry_with_presets):
+        """Test statuses are only stored once a preset's status is set."""
+        manager = PresetManager(hass, config_entry_with_presets)
+        assert manager._status == {}
+
+        await manager.set_status("preset_1", PRESET_STATUS_SUCCESS)
+
+        assert list(manager._status) == ["preset_1"]
+        assert manager.get_status("preset_2").status == PRESET_STATUS_IDLE
+
     def test_get_status_nonexistent(self, hass, config_entry):
         """Test getting status of non-existent preset."""
         manager = PresetManager(hass, config_entry)
         status = manager.get_status("nonexistent")
         assert status.status == PRESET_STATUS_IDLE
 
+    def test_get_status_idle_not_shared(self, hass, config_entry_with_presets):
+        """Test un-activated presets do not share one idle status object."""
+        manager = PresetManager(hass, config_entry_with_presets)
+        first = manager.get_status("preset_1")
+        second = manager.get_status("preset_2")
+
+        first.last_result = {"success": True}
+
+        assert second is not first
+        assert second.last_result is None
+        assert manager.get_status("preset_1").last_result is None
+
     @pytest.mark.asyncio
     async def test_set_status_activating(self, hass, config_entry_with_presets):
         """Test setting status to activating."""
@@ -374,6 +585,8 @@ class TestPresetManagerStatus:
         assert status.status == PRESET_STATUS_SUCCESS
         assert status.last_result == result
         assert status.last_activated is not None
+        # Timestamps are stored at second precision
+        assert "." not in status.last_activated
 
     @pytest.mark.asyncio
     async def test_set_status_failed(self, hass, config_entry_with_presets):
@@ -408,7 +621,7 @@ class TestPresetManagerListeners:
         unsubscribe = manager.register_listener(callback)
 
         assert callable(unsubscribe)
-        assert callback in manager._listeners
+        assert callback in manager._listeners.values()
 
     def test_unsubscribe_listener(self, hass, config_entry):
         """Test unsubscribing a listener."""
@@ -418,7 +631,18 @@ class TestPresetManagerListeners:
         unsubscribe = manager.register_listener(callback)
         unsubscribe()
 
-        assert callback not in manager._listeners
+        assert callback not in manager._listeners.values()
+
+    def test_unsubscribe_listener_registered_twice(self, hass, config_entry):
+        """Test each registration of the same callable is removed separately."""
+        manager = PresetManager(hass, config_entry)
+        callback = MagicMock()
+
+        unsubscribe_first = manager.register_listener(callback)
+        manager.register_listener(callback)
+        unsubscribe_first()
+
+        assert list(manager._listeners.values()) == [callback]
 
     @pytest.mark.asyncio
     async def test_listeners_notified_on_create(self, hass, config_entry):
@@ -446,15 +670,44 @@ class TestPresetManagerListeners:
     async def test_listeners_notified_on_status_change(
         self, hass, config_entry_with_presets
     ):
-        """Test that listeners are notified when status changes."""
+        """Test that only the changed preset's listeners see a status change."""
         manager = PresetManager(hass, config_entry_with_presets)
-        callback = MagicMock()
-        manager.register_listener(callback)
+        roster_listener = MagicMock()
+        preset_1_listener = MagicMock()
+        preset_2_listener = MagicMock()
+        manager.register_listener(roster_listener)
+        manager.register_preset_listener("preset_1", preset_1_listener)
+        manager.register_preset_listener("preset_2", preset_2_listener)
 
         await manager.set_status("preset_1", PRESET_STATUS_SUCCESS)
 
-        # set_status directly awaits _notify_listeners
-        callback.assert_called()
+        preset_1_listener.assert_called_once()
+        preset_2_listener.assert_not_called()
+        roster_listener.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_preset_listeners_notified_on_save(
+        self, hass, config_entry_with_presets
+    ):
+        """Test that preset listeners are notified when presets are saved."""
+        manager = PresetManager(hass, config_entry_with_presets)
+        preset_2_listener = MagicMock()
+        manager.register_preset_listener("preset_2", preset_2_listener)
+
+        await manager.delete_preset("preset_1")
+
+        preset_2_listener.assert_called_once()
+
+    def test_unsubscribe_preset_listener(self, hass, config_entry):
+        """Test unsubscribing the last preset listener drops its bucket."""
+        manager = PresetManager(hass, config_entry)
+
+        unsubscribe = manager.register_preset_listener("preset_1", MagicMock())
+        unsubscribe()
+        # Second unsubscribe should not raise
+        unsubscribe()
+
+        assert manager._preset_listeners == {}
 
 
 class TestPresetManagerCreateFromCurrent:
@@ -527,7 +780,7 @@ class TestPresetManagerCreateFromCurrent:
             ),
             "light.test_2": create_light_state("light.test_2", STATE_OFF),
         }
-        hass.states.get = lambda e: states.get(e)
+        hass.states.get = MagicMock(side_effect=states.get)
 
         manager = PresetManager(hass, config_entry)
         preset = await manager.create_preset_from_current(
@@ -537,6 +790,8 @@ class TestPresetManagerCreateFromCurrent:
 
         assert preset is not None
         assert preset.state == "on"  # any_on = True
+        # Each entity's state is read once
+        assert hass.states.get.call_count == 2
         assert len(preset.targets) == 2
         assert {target.get("state") for target in preset.targets} == {"on", "off"}
 
@@ -677,6 +932,7 @@ class TestPresetManagerErrorHandling:
         manager = PresetManager(hass, entry)
         # Valid preset should still be loaded
         assert "valid_preset" in manager.presets
+        assert "invalid_preset" not in manager.presets
 
     @pytest.mark.asyncio
     async def test_notify_listener_exception(self, hass, config_entry):
@@ -709,7 +965,7 @@ class TestPresetManagerErrorHandling:
         # Second unsubscribe should not raise
         unsubscribe()
 
-        assert callback not in manager._listeners
+        assert callback not in manager._listeners.values()
 
 
 class TestCoverageGaps:
@@ -756,6 +1012,59 @@ class TestCoverageGaps:
         assert call_kwargs["state_target"] == preset.state
         assert call_kwargs["default_brightness_pct"] == preset.brightness_pct
 
+    @pytest.mark.asyncio
+    async def test_activate_preset_reuses_option_configs(
+        self, hass, config_entry_with_presets
+    ):
+        """Test tolerance/retry configs are rebuilt only when options change."""
+        from unittest.mock import AsyncMock
+
+        manager = PresetManager(hass, config_entry_with_presets)
+        preset = manager.get_preset("preset_1")
+        mock_controller = MagicMock()
+        mock_controller.ensure_state = AsyncMock(return_value={"success": True})
+        options = {"brightness_tolerance": 7, "max_retries": 4, "log_success": True}
+
+        await manager.activate_preset_with_options(preset, mock_controller, options)
+        first = mock_controller.ensure_state.call_args[1]
+        await manager.activate_preset_with_options(preset, mock_controller, options)
+        second = mock_controller.ensure_state.call_args[1]
+
+        assert first["tolerances"].brightness == 7
+        assert first["retry_config"].max_retries == 4
+        assert first["log_success"] is True
+        assert second["tolerances"] is first["tolerances"]
+        assert second["retry_config"] is first["retry_config"]
+
+        await manager.activate_preset_with_options(
+            preset, mock_controller, {"brightness_tolerance": 9}
+        )
+        third = mock_controller.ensure_state.call_args[1]
+        assert third["tolerances"].brightness == 9
+        assert third["retry_config"].max_retries == 3
+        assert third["log_success"] is False
+
+    @pytest.mark.asyncio
+    async def test_activate_preset_accepts_float_max_retries(
+        self, hass, config_entry_with_presets
+    ):
+        """Test a float max_retries saved by the options form becomes an int."""
+        from unittest.mock import AsyncMock
+
+        manager = PresetManager(hass, config_entry_with_presets)
+        preset = manager.get_preset("preset_1")
+        mock_controller = MagicMock()
+        mock_controller.ensure_state = AsyncMock(return_value={"success": True})
+
+        await manager.activate_preset_with_options(
+            preset, mock_controller, {"max_retries": 3.0}
+        )
+
+        retry_config = mock_controller.ensure_state.call_args[1]["retry_config"]
+        assert retry_config.max_retries == 3
+        assert isinstance(retry_config.max_retries, int)
+        assert len(retry_config.delay_schedule()) == 3
+
     @pytest.mark.asyncio
     async def test_create_preset_from_current_light_on_no_brightness(
         self, hass, config_entry
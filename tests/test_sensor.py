@@ -57,6 +57,7 @@ def mock_preset_manager(mock_preset):
     manager.get_preset = MagicMock(return_value=mock_preset)
     manager.get_status = MagicMock(return_value=PresetStatus())
     manager.register_listener = MagicMock(return_value=MagicMock())
+    manager.register_preset_listener = MagicMock(return_value=MagicMock())
     return manager
 
 
@@ -64,7 +65,6 @@ def mock_preset_manager(mock_preset):
 def sensor_entity(hass, config_entry, mock_preset_manager, mock_preset):
     """Create a PresetStatusSensor entity."""
     return PresetStatusSensor(
-        hass=hass,
         entry=config_entry,
         preset_manager=mock_preset_manager,
         preset_id="test_preset_id",
@@ -112,6 +112,32 @@ class TestAsyncSetupEntry:
         mock_preset_manager.register_listener.assert_called()
         config_entry.async_on_unload.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_roster_listener_adds_only_new_presets(
+        self, hass, config_entry, mock_preset_manager, mock_preset
+    ):
+        """Test the roster listener adds sensors only for unseen presets."""
+        config_entry.runtime_data = MockRuntimeData(
+            preset_manager=mock_preset_manager,
+        )
+        async_add_entities = MagicMock()
+        await async_setup_entry(hass, config_entry, async_add_entities)
+        roster_listener = mock_preset_manager.register_listener.call_args[0][0]
+
+        # No new presets: nothing is added
+        roster_listener()
+        async_add_entities.assert_called_once()
+
+        mock_preset_manager.presets = {
+            "test_preset_id": mock_preset,
+            "new_preset_id": mock_preset,
+        }
+        roster_listener()
+
+        assert async_add_entities.call_count == 2
+        entities = async_add_entities.call_args[0][0]
+        assert [entity._preset_id for entity in entities] == ["new_preset_id"]
+
 
 # =============================================================================
 # PresetStatusSensor Tests
@@ -156,6 +182,7 @@ class TestPresetStatusSensorState:
         mock_preset_manager.get_status.return_value = PresetStatus(
             status=PRESET_STATUS_IDLE
         )
+        sensor_entity._handle_preset_update()
         assert sensor_entity.native_value == PRESET_STATUS_IDLE
 
     def test_native_value_activating(self, sensor_entity, mock_preset_manager):
@@ -163,6 +190,7 @@ class TestPresetStatusSensorState:
         mock_preset_manager.get_status.return_value = PresetStatus(
             status=PRESET_STATUS_ACTIVATING
         )
+        sensor_entity._handle_preset_update()
         assert sensor_entity.native_value == PRESET_STATUS_ACTIVATING
 
     def test_native_value_success(self, sensor_entity, mock_preset_manager):
@@ -170,6 +198,7 @@ class TestPresetStatusSensorState:
         mock_preset_manager.get_status.return_value = PresetStatus(
             status=PRESET_STATUS_SUCCESS
         )
+        sensor_entity._handle_preset_update()
         assert sensor_entity.native_value == PRESET_STATUS_SUCCESS
 
     def test_native_value_failed(self, sensor_entity, mock_preset_manager):
@@ -177,6 +206,7 @@ class TestPresetStatusSensorState:
         mock_preset_manager.get_status.return_value = PresetStatus(
             status=PRESET_STATUS_FAILED
         )
+        sensor_entity._handle_preset_update()
         assert sensor_entity.native_value == PRESET_STATUS_FAILED
 
 
@@ -203,6 +233,7 @@ class TestPresetStatusSensorAttributes:
                 "elapsed_seconds": 3.5,
             },
         )
+        sensor_entity._handle_preset_update()
 
         attrs = sensor_entity.extra_state_attributes
         assert attrs["last_activated"] == "2024-01-15T10:30:00"
@@ -224,6 +255,7 @@ class TestPresetStatusSensorAttributes:
                 "skipped_lights": ["light.test_2"],
             },
         )
+        sensor_entity._handle_preset_update()
 
         attrs = sensor_entity.extra_state_attributes
         assert attrs["failed_lights"] == ["light.test_1"]
@@ -241,18 +273,23 @@ class TestPresetStatusSensorAttributes:
                 "skipped_lights": [],
             },
         )
+        sensor_entity._handle_preset_update()
 
         attrs = sensor_entity.extra_state_attributes
         assert "failed_lights" not in attrs
         assert "skipped_lights" not in attrs
 
-    def test_attributes_when_preset_deleted(self, sensor_entity, mock_preset_manager):
-        """Test attributes when preset no longer exists."""
+    def test_attributes_kept_when_preset_deleted(
+        self, sensor_entity, mock_preset_manager
+    ):
+        """Test attributes are left alone while a deleted preset's sensor is removed."""
+        attrs = sensor_entity.extra_state_attributes
         mock_preset_manager.get_preset.return_value = None
+        sensor_entity.async_remove = MagicMock()
 
-        attrs = sensor_entity.extra_state_attributes
-        assert attrs["preset_id"] == "test_preset_id"
-        assert "preset_name" not in attrs
+        sensor_entity._handle_preset_update()
+
+        assert sensor_entity.extra_state_attributes is attrs
 
 
 class TestPresetStatusSensorAvailability:
@@ -265,6 +302,10 @@ class TestPresetStatusSensorAvailability:
     def test_unavailable_when_preset_deleted(self, sensor_entity, mock_preset_manager):
         """Test availability when preset is deleted."""
         mock_preset_manager.get_preset.return_value = None
+        sensor_entity.async_remove = MagicMock()
+
+        sensor_entity._handle_preset_update()
+
         assert sensor_entity.available is False
 
 
@@ -278,7 +319,7 @@ class TestPresetStatusSensorLifecycle:
 
         await sensor_entity.async_added_to_hass()
 
-        mock_preset_manager.register_listener.assert_called()
+        mock_preset_manager.register_preset_listener.assert_called_once()
         sensor_entity.async_on_remove.assert_called()
 
     @pytest.mark.asyncio
@@ -305,10 +346,27 @@ class TestPresetStatusSensorLifecycle:
         assert sensor_entity._attr_translation_placeholders == {"name": "Updated Name"}
         sensor_entity.async_write_ha_state.assert_called_once()
 
+    def test_handle_preset_update_skips_unchanged(
+        self, sensor_entity, mock_preset_manager
+    ):
+        """Test repeated updates without changes write state once."""
+        sensor_entity.async_write_ha_state = MagicMock()
+
+        sensor_entity._handle_preset_update()
+        sensor_entity._handle_preset_update()
+        sensor_entity.async_write_ha_state.assert_called_once()
+
+        mock_preset_manager.get_status.return_value = PresetStatus(
+            status=PRESET_STATUS_SUCCESS
+        )
+        sensor_entity._handle_preset_update()
+        assert sensor_entity.async_write_ha_state.call_count == 2
+
     def test_handle_preset_update_deleted(
         self, sensor_entity, mock_preset_manager, hass
     ):
         """Test handling when preset is deleted schedules self-removal."""
+        sensor_entity.hass = hass
         sensor_entity.async_write_ha_state = MagicMock()
         sensor_entity.async_remove = AsyncMock()
         mock_preset_manager.get_preset.return_value = None
@@ -319,3 +377,16 @@ class TestPresetStatusSensorLifecycle:
         sensor_entity.async_write_ha_state.assert_not_called()
         # Should schedule self-removal via async_create_task
         hass.async_create_task.assert_called_once()
+
+    def test_handle_preset_update_deleted_removes_once(
+        self, sensor_entity, mock_preset_manager, hass
+    ):
+        """Test repeated updates for a deleted preset schedule one removal."""
+        sensor_entity.hass = hass
+        sensor_entity.async_remove = MagicMock()
+        mock_preset_manager.get_preset.return_value = None
+
+        sensor_entity._handle_preset_update()
+        sensor_entity._handle_preset_update()
+
+        hass.async_create_task.assert_called_once()